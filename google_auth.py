@@ -6,10 +6,8 @@ Obsługa OAuth 2.0 (InstalledAppFlow), zwraca obiekty serwisowe dla Drive i Shee
 import os
 from typing import Tuple
 
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from google.auth.transport.requests import Request
+# Biblioteki Google importowane są dopiero w funkcjach (~0.3 s importu),
+# żeby GUI i `main.py --help` startowały bez czekania na klienta API.
 
 SCOPES = [
     "https://www.googleapis.com/auth/spreadsheets.readonly",
@@ -21,6 +19,10 @@ TOKEN_FILE = "token.json"
 
 
 def get_credentials():
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
+    from google.auth.transport.requests import Request
+
     creds = None
     if os.path.exists(TOKEN_FILE):
         creds = Credentials.from_authorized_user_file(TOKEN_FILE, SCOPES)
@@ -46,6 +48,8 @@ def build_services() -> Tuple[object, object]:
     """
     Zwraca (drive_service, sheets_service)
     """
+    from googleapiclient.discovery import build
+
     creds = get_credentials()
     drive_service = build("drive", "v3", credentials=creds, cache_discovery=False)
     sheets_service = build("sheets", "v4", credentials=creds, cache_discovery=False)
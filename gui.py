@@ -32,8 +32,8 @@ from quadra_service import (
     read_dbf_column,
     search_dbf_values_in_sheets,
     format_quadra_result_for_table,
-    export_quadra_results_to_json,
-    export_quadra_results_to_csv,
+    export_quadra_results_to_json_stream,
+    export_quadra_results_to_csv_iter,
     get_dbf_field_names,
     read_dbf_records_with_extra_fields,
     detect_dbf_field_name,
@@ -1830,9 +1830,8 @@ def main():
             )
             if filename:
                 try:
-                    export_data = export_quadra_results_to_json(results)
                     with open(filename, "w", encoding="utf-8") as f:
-                        json.dump(export_data, f, ensure_ascii=False, indent=2)
+                        export_quadra_results_to_json_stream(results, f)
                     sg.popup(f"Zapisano {len(results)} wyników do:\n{filename}", title="Eksport zakończony")
                     window["-STATUS_BAR-"].update(f"Wyniki zapisane do: {filename}")
                 except Exception as e:
@@ -1852,9 +1851,8 @@ def main():
             )
             if filename:
                 try:
-                    csv_data = export_quadra_results_to_csv(results)
                     with open(filename, "w", encoding="utf-8") as f:
-                        f.write(csv_data)
+                        f.writelines(export_quadra_results_to_csv_iter(results))
                     sg.popup(f"Zapisano {len(results)} wyników do:\n{filename}", title="Eksport zakończony")
                     window["-STATUS_BAR-"].update(f"Wyniki zapisane do: {filename}")
                 except Exception as e:
@@ -5,7 +5,8 @@ Prosty CLI do listowania i przeszukiwania arkuszy.
 
 import argparse
 import json
-from typing import Optional, Union, Dict, List, Any
+from functools import lru_cache
+from typing import Optional, Union, Dict, List, Any, Callable, Tuple
 from google_auth import build_services
 from sheets_search import list_spreadsheets_owned_by_me, search_in_spreadsheets
 
@@ -39,52 +40,121 @@ def parse_column_names_arg(column_names_str: Optional[str]) -> Optional[Union[Di
     return None
 
 
-def map_result_keys(
-    result: Dict[str, Any],
-    column_names: Optional[Union[Dict[str, str], List[str]]]
-) -> Dict[str, Any]:
+# Default keys in search results (order used for list-based mapping)
+DEFAULT_RESULT_KEYS = ('spreadsheetId', 'spreadsheetName', 'sheetName', 'cell',
+                       'searchedValue', 'stawka')
+
+
+@lru_cache(maxsize=64)
+def _compile_renamer(
+    kind: str,
+    payload: Tuple[Any, ...],
+    default_keys: Tuple[str, ...] = DEFAULT_RESULT_KEYS
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
     """
-    Map result dictionary keys to custom column names.
+    Build a renamer function for a hashable form of column_names.
     
     Args:
-        result: Result dictionary with default keys
-        column_names: Dict or List for mapping
+        kind: 'dict' or 'list'
+        payload: Tuple of (old_key, new_key) pairs for 'dict', tuple of names for 'list'
+        default_keys: Default result keys, used for positional ('list') mapping
     
     Returns:
-        Dictionary with mapped keys
+        Function mapping a result dictionary to a dictionary with renamed keys
     """
-    if column_names is None:
-        return result
-    
-    # Default keys in search results
-    default_keys = ['spreadsheetId', 'spreadsheetName', 'sheetName', 'cell', 
-                    'searchedValue', 'stawka']
+    if kind == 'dict':
+        rename = dict(payload)
+        
+        def _rename_dict(result: Dict[str, Any]) -> Dict[str, Any]:
+            return {rename.get(key, key): value for key, value in result.items()}
+        
+        return _rename_dict
     
-    if isinstance(column_names, dict):
-        # Map using dictionary
-        mapped = {}
-        for key, value in result.items():
-            mapped[column_names.get(key, key)] = value
-        return mapped
+    # Map using list in order; keys without a name keep their original key
+    pairs = tuple(
+        (key, payload[i] if i < len(payload) else key)
+        for i, key in enumerate(default_keys)
+    )
+    known = frozenset(default_keys)
     
-    if isinstance(column_names, list):
-        # Map using list in order
-        mapped = {}
-        for i, key in enumerate(default_keys):
-            if key in result:
-                if i < len(column_names):
-                    mapped[column_names[i]] = result[key]
-                else:
-                    mapped[key] = result[key]
+    def _rename_list(result: Dict[str, Any]) -> Dict[str, Any]:
+        mapped = {new: result[old] for old, new in pairs if old in result}
         # Include any extra keys not in default_keys
         for key, value in result.items():
-            if key not in default_keys:
+            if key not in known:
                 mapped[key] = value
         return mapped
     
+    return _rename_list
+
+
+def _identity(result: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
+def build_renamer(
+    column_names: Optional[Union[Dict[str, str], List[str]]]
+) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Build a function renaming result keys according to column_names.
+    
+    The rename plan is computed once per distinct column_names and cached,
+    so applying it to many results costs only the dictionary construction.
+    
+    Args:
+        column_names: Dict or List for mapping (or None)
+    
+    Returns:
+        Function taking a result dictionary and returning it with mapped keys
+        (identity if column_names is None or of unsupported type)
+    """
+    if isinstance(column_names, dict):
+        # Sorted items: equal mappings share one cache entry regardless of key order
+        return _compile_renamer('dict', tuple(sorted(column_names.items())))
+    if isinstance(column_names, list):
+        return _compile_renamer('list', tuple(column_names))
+    return _identity
+
+
+def build_result_renamer(
+    column_names_str: Optional[str]
+) -> Optional[Callable[[Dict[str, Any]], Dict[str, Any]]]:
+    """
+    Parse --column-names argument and build the result renamer in one step.
+    
+    Args:
+        column_names_str: Raw --column-names value (see parse_column_names_arg)
+    
+    Returns:
+        Renamer function (identity if column_names_str is empty)
+        or None if the format is invalid
+    """
+    if not column_names_str:
+        return _identity
+    
+    column_names = parse_column_names_arg(column_names_str)
+    if column_names is None:
+        return None
+    return build_renamer(column_names)
+
+
+def map_result_keys(
+    result: Dict[str, Any],
+    column_names: Optional[Union[Dict[str, str], List[str]]]
+) -> Dict[str, Any]:
+    """
+    Map result dictionary keys to custom column names.
+    
+    Args:
+        result: Result dictionary with default keys
+        column_names: Dict or List for mapping
+    
+    Returns:
+        Dictionary with mapped keys
+    """
+    return build_renamer(column_names)(result)
+
+
 def cmd_list():
     drive, sheets = build_services()
     files = list_spreadsheets_owned_by_me(drive)
@@ -102,11 +172,11 @@ def cmd_search(args):
         case_sensitive=args.case,
         max_files=args.max_files,
     )
+    # Column name mapping (identity if --column-names not provided)
+    rename_result = args.rename_result
     count = 0
     for r in results:
-        # Apply column name mapping if provided
-        if args.column_names:
-            r = map_result_keys(r, args.column_names)
+        r = rename_result(r)
         print(json.dumps(r, ensure_ascii=False))
         count += 1
     print(f"\nZnaleziono: {count} dopasowań")
@@ -130,13 +200,9 @@ def main():
     
     # Parse column names if provided for search command
     if args.cmd == "search":
-        column_names_str = getattr(args, 'column_names', None)
-        if column_names_str:
-            args.column_names = parse_column_names_arg(column_names_str)
-            if args.column_names is None:
-                p_search.error("Nieprawidłowy format --column-names. Użyj JSON object, JSON array lub listy rozdzielonej przecinkami.")
-        else:
-            args.column_names = None
+        args.rename_result = build_result_renamer(getattr(args, 'column_names', None))
+        if args.rename_result is None:
+            p_search.error("Nieprawidłowy format --column-names. Użyj JSON object, JSON array lub listy rozdzielonej przecinkami.")
     
     if args.cmd == "list":
         cmd_list()
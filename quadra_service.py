@@ -10,16 +10,22 @@ Functions:
 """
 
 import csv
-import io
+import json
 import logging
+import operator
 import re
-from typing import List, Dict, Any, Optional, Union, Tuple
-from dbfread import DBF
+from collections import OrderedDict
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Union, Tuple, NamedTuple, Iterable, Iterator, Callable, TextIO
+from dbfread import DBF, FieldParser
 from sheets_search import (
     normalize_number_string,
     normalize_header_name,
     find_all_column_indices_by_name,
+    build_header_index,
     col_index_to_a1,
+    get_sheet_data,
+    get_sheet_data_many,
 )
 
 logger = logging.getLogger(__name__)
@@ -29,6 +35,22 @@ DBF_STAWKA_FIELD_NAMES = ['STAWKA', 'STAW', 'RATE', 'PRICE', 'CENA']
 DBF_CZESCI_FIELD_NAMES = ['CZESCI', 'PARTS', 'CZESC', 'PART']
 DBF_NUMER_FIELD_NAMES = ['NUMER', 'NUMBER', 'NR', 'ORDER', 'ZLECENIE']
 
+# Default Quadra table headers (Polish names used in GUI)
+QUADRA_TABLE_HEADERS = (
+    'Arkusz',       # Sheet name
+    'Płatnik',      # Payer
+    'Numer z DBF',  # DBF Number
+    'Stawka',       # Rate
+    'Czesci',       # Parts
+    'Status',       # Status (Found/Missing)
+    'Kolumna',      # Column name
+    'Wiersz',       # Row number
+    'Uwagi',        # Notes
+)
+
+# Column letters A..ZZ -> 0-based index, built once from the same labels used for A1 addresses
+_COLUMN_INDEX_BY_LETTERS = {col_index_to_a1(i): i for i in range(702)}
+
 
 def column_letter_to_index(column: str) -> int:
     """
@@ -44,6 +66,10 @@ def column_letter_to_index(column: str) -> int:
         'A' -> 0, 'B' -> 1, 'Z' -> 25, 'AA' -> 26
     """
     column = column.upper().strip()
+    index = _COLUMN_INDEX_BY_LETTERS.get(column)
+    if index is not None:
+        return index
+    # Columns past ZZ (and unexpected input) use the base-26 conversion
     result = 0
     for char in column:
         result = result * 26 + (ord(char) - ord('A') + 1)
@@ -121,39 +147,31 @@ def detect_dbf_field_name(field_names: List[str], possible_names: List[str]) ->
     return None
 
 
-def map_dbf_record_to_result(
-    record: Dict[str, Any], 
+class DbfFieldMap(NamedTuple):
+    """DBF field names resolved for each result field (None if not found)."""
+    numer_dbf: Optional[str]
+    stawka: Optional[str]
+    czesci: Optional[str]
+    platnik: Optional[str]
+
+
+def resolve_dbf_field_map(
     field_names: List[str],
     mapping: Optional[Dict[str, str]] = None
-) -> Dict[str, Any]:
+) -> DbfFieldMap:
     """
-    Map a DBF record to a result dictionary with detected or user-specified fields.
+    Resolve which DBF fields hold the result fields, using user mapping or autodetection.
     
-    Detects and extracts:
-    - 'numer_dbf' from field names: NUMER, NUMBER, NR, ORDER, ZLECENIE
-    - 'stawka' from field names: STAWKA, STAW, RATE, PRICE, CENA
-    - 'czesci' from field names: CZESCI, PARTS, CZESC, PART
-    - 'platnik' from user mapping only (no auto-detection)
+    The result depends only on the table's field names, so it can be computed once
+    per DBF file and reused for every record (see map_dbf_record_to_result).
     
     Args:
-        record: DBF record as dictionary
         field_names: List of all field names in the DBF table
         mapping: Optional dict mapping app_field -> dbf_field_name
-                 e.g., {'stawka': 'RATE', 'czesci': 'PARTS', 'numer_dbf': 'ORDER', 'platnik': 'PAYER'}
                  If provided, overrides autodetection for specified fields
     
     Returns:
-        Dictionary with 'numer_dbf', 'stawka', 'czesci', and 'platnik' keys (empty strings if not found)
-    
-    Examples:
-        >>> record = {'NUMER': '12345', 'STAWKA': '150.00', 'CZESCI': 'ABC'}
-        >>> field_names = ['NUMER', 'STAWKA', 'CZESCI']
-        >>> map_dbf_record_to_result(record, field_names)
-        {'numer_dbf': '12345', 'stawka': '150.00', 'czesci': 'ABC', 'platnik': ''}
-        
-        >>> # With custom mapping including platnik
-        >>> map_dbf_record_to_result(record, field_names, {'stawka': 'STAWKA', 'czesci': 'CZESCI', 'platnik': 'PAYER'})
-        {'numer_dbf': '12345', 'stawka': '150.00', 'czesci': 'ABC', 'platnik': ''}
+        DbfFieldMap with the DBF field name for each result field
     """
     mapping = mapping or {}
     
@@ -178,57 +196,106 @@ def map_dbf_record_to_result(
     if 'platnik' in mapping and mapping['platnik'] in field_names:
         platnik_field = mapping['platnik']
     
-    # Extract values
-    numer_value = ''
-    if numer_field and numer_field in record:
-        val = record[numer_field]
+    return DbfFieldMap(numer_field, stawka_field, czesci_field, platnik_field)
+
+
+def _get_dbf_field_value(record: Dict[str, Any], field_name: Optional[str]) -> str:
+    """Return the stripped string value of a record field ('' if missing or None)."""
+    if field_name and field_name in record:
+        val = record[field_name]
         if val is not None:
-            numer_value = str(val).strip()
+            return str(val).strip()
+    return ''
+
+
+def map_dbf_record_to_result(
+    record: Dict[str, Any], 
+    field_names: List[str],
+    mapping: Optional[Dict[str, str]] = None,
+    field_map: Optional[DbfFieldMap] = None
+) -> Dict[str, Any]:
+    """
+    Map a DBF record to a result dictionary with detected or user-specified fields.
     
-    stawka_value = ''
-    if stawka_field and stawka_field in record:
-        val = record[stawka_field]
-        if val is not None:
-            stawka_value = str(val).strip()
+    Detects and extracts:
+    - 'numer_dbf' from field names: NUMER, NUMBER, NR, ORDER, ZLECENIE
+    - 'stawka' from field names: STAWKA, STAW, RATE, PRICE, CENA
+    - 'czesci' from field names: CZESCI, PARTS, CZESC, PART
+    - 'platnik' from user mapping only (no auto-detection)
     
-    czesci_value = ''
-    if czesci_field and czesci_field in record:
-        val = record[czesci_field]
-        if val is not None:
-            czesci_value = str(val).strip()
+    Args:
+        record: DBF record as dictionary
+        field_names: List of all field names in the DBF table
+        mapping: Optional dict mapping app_field -> dbf_field_name
+                 e.g., {'stawka': 'RATE', 'czesci': 'PARTS', 'numer_dbf': 'ORDER', 'platnik': 'PAYER'}
+                 If provided, overrides autodetection for specified fields
+        field_map: Optional fields already resolved with resolve_dbf_field_map
+                   (field_names and mapping are then not used); pass it when mapping many records
     
-    # Extract platnik value if mapped
-    platnik_value = ''
-    if platnik_field and platnik_field in record:
-        val = record[platnik_field]
-        if val is not None:
-            platnik_value = str(val).strip()
+    Returns:
+        Dictionary with 'numer_dbf', 'stawka', 'czesci', and 'platnik' keys (empty strings if not found)
+    
+    Examples:
+        >>> record = {'NUMER': '12345', 'STAWKA': '150.00', 'CZESCI': 'ABC'}
+        >>> field_names = ['NUMER', 'STAWKA', 'CZESCI']
+        >>> map_dbf_record_to_result(record, field_names)
+        {'numer_dbf': '12345', 'stawka': '150.00', 'czesci': 'ABC', 'platnik': ''}
+        
+        >>> # With custom mapping including platnik
+        >>> map_dbf_record_to_result(record, field_names, {'stawka': 'STAWKA', 'czesci': 'CZESCI', 'platnik': 'PAYER'})
+        {'numer_dbf': '12345', 'stawka': '150.00', 'czesci': 'ABC', 'platnik': ''}
+    """
+    if field_map is None:
+        field_map = resolve_dbf_field_map(field_names, mapping)
     
     return {
-        'numer_dbf': numer_value,
-        'stawka': stawka_value,
-        'czesci': czesci_value,
-        'platnik': platnik_value
+        'numer_dbf': _get_dbf_field_value(record, field_map.numer_dbf),
+        'stawka': _get_dbf_field_value(record, field_map.stawka),
+        'czesci': _get_dbf_field_value(record, field_map.czesci),
+        'platnik': _get_dbf_field_value(record, field_map.platnik)
     }
 
 
-def read_dbf_column(dbf_path: str, column_identifier: Union[str, int] = 'B') -> List[Any]:
+def _selected_fields_parser(field_names: Iterable[str]) -> type:
     """
-    Read values from a specific column in a DBF file.
+    Build a dbfread parser class that decodes only the selected fields.
+    
+    Args:
+        field_names: Names of the fields to decode
+    
+    Returns:
+        FieldParser subclass returning None for every other field
+    """
+    selected = frozenset(field_names)
+    
+    class _SelectedFieldsParser(FieldParser):
+        def parse(self, field, data):
+            if field.name not in selected:
+                return None
+            return FieldParser.parse(self, field, data)
+    
+    return _SelectedFieldsParser
+
+
+def read_dbf_columns(
+    dbf_path: str,
+    column_identifiers: List[Union[str, int]]
+) -> Dict[Union[str, int], List[Any]]:
+    """
+    Read values from several columns of a DBF file in a single pass over the records.
     
     Args:
         dbf_path: Path to the DBF file
-        column_identifier: Column to read - can be:
+        column_identifiers: Columns to read - each can be:
             - Letter: 'A', 'B', 'C', etc.
             - 1-based index: 1, 2, 3, etc.
-            - Default: 'B' (second column)
     
     Returns:
-        List of values from the specified column (excluding None/empty values)
+        Dictionary {column_identifier: list of values} (excluding None/empty values)
     
     Raises:
         FileNotFoundError: If DBF file doesn't exist
-        ValueError: If column identifier is invalid or column doesn't exist
+        ValueError: If a column identifier is invalid or a column doesn't exist
     """
     from dbfread.exceptions import DBFNotFound
     
@@ -239,33 +306,60 @@ def read_dbf_column(dbf_path: str, column_identifier: Union[str, int] = 'B') ->
     except Exception as e:
         raise ValueError(f"Error opening DBF file: {e}")
     
-    # Get column index
-    col_index = parse_column_identifier(column_identifier)
-    
     # Get field names
     field_names = table.field_names
     
-    if col_index < 0 or col_index >= len(field_names):
-        raise ValueError(
-            f"Column index {col_index} (from '{column_identifier}') is out of range. "
-            f"DBF has {len(field_names)} columns: {', '.join(field_names)}"
-        )
+    # Resolve all requested columns before reading any record
+    columns: Dict[Union[str, int], str] = {}
+    for column_identifier in column_identifiers:
+        col_index = parse_column_identifier(column_identifier)
+        if col_index < 0 or col_index >= len(field_names):
+            raise ValueError(
+                f"Column index {col_index} (from '{column_identifier}') is out of range. "
+                f"DBF has {len(field_names)} columns: {', '.join(field_names)}"
+            )
+        columns[column_identifier] = field_names[col_index]
+        logger.info(f"Reading column '{field_names[col_index]}' (index {col_index}) from DBF file")
     
-    field_name = field_names[col_index]
-    logger.info(f"Reading column '{field_name}' (index {col_index}) from DBF file")
+    # Decode only the requested fields; the other fields of each record stay None
+    table.parserclass = _selected_fields_parser(columns.values())
     
     # Extract values
-    values = []
+    values: Dict[Union[str, int], List[Any]] = {column_identifier: [] for column_identifier in columns}
+    targets = [(field_name, values[column_identifier]) for column_identifier, field_name in columns.items()]
     for record in table:
-        value = record.get(field_name)
-        # Skip None and empty values
-        if value is not None and str(value).strip():
-            values.append(value)
-    
-    logger.info(f"Read {len(values)} non-empty values from DBF column '{field_name}'")
+        for field_name, column_values in targets:
+            value = record.get(field_name)
+            # Skip None and empty values
+            if value is not None and str(value).strip():
+                column_values.append(value)
+    
+    for column_identifier, field_name in columns.items():
+        logger.info(f"Read {len(values[column_identifier])} non-empty values from DBF column '{field_name}'")
     return values
 
 
+def read_dbf_column(dbf_path: str, column_identifier: Union[str, int] = 'B') -> List[Any]:
+    """
+    Read values from a specific column in a DBF file.
+    
+    Args:
+        dbf_path: Path to the DBF file
+        column_identifier: Column to read - can be:
+            - Letter: 'A', 'B', 'C', etc.
+            - 1-based index: 1, 2, 3, etc.
+            - Default: 'B' (second column)
+    
+    Returns:
+        List of values from the specified column (excluding None/empty values)
+    
+    Raises:
+        FileNotFoundError: If DBF file doesn't exist
+        ValueError: If column identifier is invalid or column doesn't exist
+    """
+    return read_dbf_columns(dbf_path, [column_identifier])[column_identifier]
+
+
 def get_dbf_field_names(dbf_path: str) -> List[str]:
     """
     Get list of field names from a DBF file.
@@ -304,18 +398,44 @@ def read_dbf_records_with_extra_fields(
     """
     Read DBF records with main column value and additional fields (numer_dbf, stawka, czesci, platnik).
     
+    List version of iter_dbf_records_with_extra_fields (same arguments, records and exceptions).
+    
     Args:
         dbf_path: Path to the DBF file
         column_identifier: Column to read main values from (default 'B')
         mapping: Optional dict mapping app_field -> dbf_field_name
-                 e.g., {'stawka': 'RATE', 'czesci': 'PARTS', 'numer_dbf': 'ORDER', 'platnik': 'PAYER'}
     
     Returns:
         List of dictionaries with 'value', 'numer_dbf', 'stawka', 'czesci', and 'platnik' keys
+    """
+    records = list(iter_dbf_records_with_extra_fields(dbf_path, column_identifier, mapping))
+    logger.info(f"Read {len(records)} records from DBF with extra fields")
+    return records
+
+
+def iter_dbf_records_with_extra_fields(
+    dbf_path: str, 
+    column_identifier: Union[str, int] = 'B',
+    mapping: Optional[Dict[str, str]] = None
+) -> Iterator[Dict[str, Any]]:
+    """
+    Read DBF records with main column value and additional fields (numer_dbf, stawka, czesci, platnik).
+    
+    The file is opened and the column is validated immediately; records are then
+    read lazily, one at a time, so large DBF files are never held in memory at once.
+    
+    Args:
+        dbf_path: Path to the DBF file
+        column_identifier: Column to read main values from (default 'B')
+        mapping: Optional dict mapping app_field -> dbf_field_name
+                 e.g., {'stawka': 'RATE', 'czesci': 'PARTS', 'numer_dbf': 'ORDER', 'platnik': 'PAYER'}
+    
+    Returns:
+        Iterator of dictionaries with 'value', 'numer_dbf', 'stawka', 'czesci', and 'platnik' keys
         
     Example:
-        >>> records = read_dbf_records_with_extra_fields('orders.dbf', 'B')
-        >>> records[0]
+        >>> records = iter_dbf_records_with_extra_fields('orders.dbf', 'B')
+        >>> next(records)
         {'value': '12345', 'numer_dbf': '12345', 'stawka': '150.00', 'czesci': 'ABC', 'platnik': 'XYZ'}
     
     Raises:
@@ -346,8 +466,19 @@ def read_dbf_records_with_extra_fields(
     main_field_name = field_names[col_index]
     logger.info(f"Reading records from DBF, main column: '{main_field_name}' (index {col_index})")
     
-    # Read all records
-    records = []
+    # Resolve extra fields once for the whole table
+    field_map = resolve_dbf_field_map(field_names, mapping)
+    
+    return _iter_dbf_records(table, field_names, main_field_name, field_map)
+
+
+def _iter_dbf_records(
+    table: DBF,
+    field_names: List[str],
+    main_field_name: str,
+    field_map: DbfFieldMap
+) -> Iterator[Dict[str, Any]]:
+    """Yield non-empty records of an opened DBF table with their extra fields."""
     for record in table:
         # Get main value
         main_value = record.get(main_field_name)
@@ -355,18 +486,15 @@ def read_dbf_records_with_extra_fields(
             continue  # Skip empty records
         
         # Map additional fields (including platnik if mapped)
-        extra_fields = map_dbf_record_to_result(record, field_names, mapping)
+        extra_fields = map_dbf_record_to_result(record, field_names, field_map=field_map)
         
-        records.append({
+        yield {
             'value': main_value,
             'numer_dbf': extra_fields['numer_dbf'],
             'stawka': extra_fields['stawka'],
             'czesci': extra_fields['czesci'],
             'platnik': extra_fields['platnik']
-        })
-    
-    logger.info(f"Read {len(records)} records from DBF with extra fields")
-    return records
+        }
 
 
 def normalize_value_for_comparison(value: Any, mode: str = 'exact') -> str:
@@ -383,6 +511,15 @@ def normalize_value_for_comparison(value: Any, mode: str = 'exact') -> str:
     if value is None:
         return ""
     
+    try:
+        return _normalize_value_cached(value, mode)
+    except TypeError:
+        # Unhashable value (e.g. a list) - normalize without the cache
+        return _normalize_value(value, mode)
+
+
+def _normalize_value(value: Any, mode: str = 'exact') -> str:
+    """Normalize a non-None value for comparison (uncached implementation)."""
     # Convert to string
     value_str = str(value)
     
@@ -398,6 +535,10 @@ def normalize_value_for_comparison(value: Any, mode: str = 'exact') -> str:
     return value_str
 
 
+# DBF numbers and sheet cells repeat across lookups; typed=True keeps 1, 1.0 and True apart
+_normalize_value_cached = lru_cache(maxsize=65536, typed=True)(_normalize_value)
+
+
 def values_match(dbf_value: Any, sheet_value: Any, mode: str = 'exact') -> bool:
     """
     Check if two values match according to the specified mode.
@@ -422,12 +563,27 @@ def values_match(dbf_value: Any, sheet_value: Any, mode: str = 'exact') -> bool:
     if not dbf_normalized or not sheet_normalized:
         return False
     
+    return _get_matcher(mode)(dbf_normalized, sheet_normalized)
+
+
+def _contains_either(a: str, b: str) -> bool:
+    """Check if either normalized value contains the other."""
+    return a in b or b in a
+
+
+def _get_matcher(mode: str) -> Callable[[str, str], bool]:
+    """
+    Select the comparator for normalized values once per search.
+    
+    Args:
+        mode: Comparison mode - 'exact' or 'substring'
+    
+    Returns:
+        Function comparing two non-empty normalized strings
+    """
     if mode == 'substring':
-        # Check if either value contains the other
-        return dbf_normalized in sheet_normalized or sheet_normalized in dbf_normalized
-    else:
-        # Exact match (after normalization)
-        return dbf_normalized == sheet_normalized
+        return _contains_either
+    return operator.eq
 
 
 def search_value_in_sheet_data(
@@ -464,17 +620,14 @@ def search_value_in_sheet_data(
     
     # Get headers (first row by default)
     headers = sheet_values[header_row_index] if len(sheet_values) > header_row_index else []
+    columns_to_search = _get_columns_to_search(headers, column_names)
     
-    # Determine which columns to search
-    columns_to_search = []
-    if column_names:
-        # Search only in specified columns
-        for col_name in column_names:
-            indices = find_all_column_indices_by_name(headers, col_name)
-            columns_to_search.extend(indices)
-    else:
-        # Search all columns
-        columns_to_search = list(range(len(headers)))
+    # Normalize the target and pick the comparator once, not per cell
+    # (same semantics as values_match)
+    matcher = _get_matcher(mode)
+    target_normalized = normalize_value_for_comparison(target_value, mode)
+    if target_value is not None and not target_normalized:
+        return None
     
     # Search in data rows (after header)
     for row_idx in range(header_row_index + 1, len(sheet_values)):
@@ -482,24 +635,123 @@ def search_value_in_sheet_data(
         for col_idx in columns_to_search:
             if col_idx < len(row):
                 cell_value = row[col_idx]
-                if values_match(target_value, cell_value, mode):
+                if target_value is None:
+                    matched = cell_value is None
+                elif cell_value is None:
+                    matched = False
+                else:
+                    cell_normalized = normalize_value_for_comparison(cell_value, mode)
+                    matched = bool(cell_normalized) and matcher(target_normalized, cell_normalized)
+                if matched:
                     # Found a match
-                    col_name = headers[col_idx] if col_idx < len(headers) else f"Column {col_index_to_a1(col_idx)}"
-                    return {
-                        'sheetName': sheet_name,
-                        'columnIndex': col_idx,
-                        'columnName': col_name,
-                        'rowIndex': row_idx,
-                        'value': cell_value
-                    }
+                    return _build_match_info(sheet_name, headers, row_idx, col_idx, cell_value)
     
     return None
 
 
+def _get_columns_to_search(headers: List[Any], column_names: Optional[List[str]]) -> List[int]:
+    """Return indices of the columns to search (all columns if column_names is empty)."""
+    if not column_names:
+        return list(range(len(headers)))
+    # Search only in specified columns (headers normalized once for all names)
+    columns_to_search = []
+    header_index = build_header_index(headers)
+    for col_name in column_names:
+        columns_to_search.extend(find_all_column_indices_by_name(headers, col_name, header_index=header_index))
+    return columns_to_search
+
+
+def _build_match_info(
+    sheet_name: str,
+    headers: List[Any],
+    row_idx: int,
+    col_idx: int,
+    cell_value: Any
+) -> Dict[str, Any]:
+    """Build the match dictionary returned by search_value_in_sheet_data."""
+    col_name = headers[col_idx] if col_idx < len(headers) else f"Column {col_index_to_a1(col_idx)}"
+    return {
+        'sheetName': sheet_name,
+        'columnIndex': col_idx,
+        'columnName': col_name,
+        'rowIndex': row_idx,
+        'value': cell_value
+    }
+
+
+def build_sheet_value_index(
+    sheet_values: List[List[Any]],
+    sheet_name: str,
+    column_names: Optional[List[str]] = None,
+    header_row_index: int = 0
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Index sheet data by normalized cell value for exact-mode lookups.
+    
+    Each normalized value maps to the match that search_value_in_sheet_data would
+    return for it in 'exact' mode (the first matching cell, scanning rows top to bottom
+    and the searched columns in order), so many values can be looked up in one sheet
+    with a single pass over its cells.
+    
+    Args:
+        sheet_values: 2D array of sheet values
+        sheet_name: Name of the sheet
+        column_names: Optional list of column names to restrict search
+        header_row_index: Index of header row (default 0)
+    
+    Returns:
+        Dictionary {normalized_value: match details} (same format as search_value_in_sheet_data)
+    """
+    index: Dict[str, Dict[str, Any]] = {}
+    if not sheet_values:
+        return index
+    
+    headers = sheet_values[header_row_index] if len(sheet_values) > header_row_index else []
+    columns_to_search = _get_columns_to_search(headers, column_names)
+    
+    for row_idx in range(header_row_index + 1, len(sheet_values)):
+        row = sheet_values[row_idx]
+        for col_idx in columns_to_search:
+            if col_idx < len(row):
+                cell_value = row[col_idx]
+                normalized = normalize_value_for_comparison(cell_value)
+                if normalized and normalized not in index:
+                    index[normalized] = _build_match_info(sheet_name, headers, row_idx, col_idx, cell_value)
+    
+    return index
+
+
+def _find_in_sheet_index(
+    index: Dict[str, Dict[str, Any]],
+    target_normalized: str,
+    matcher: Callable[[str, str], bool]
+) -> Optional[Dict[str, Any]]:
+    """
+    Find the first indexed sheet value accepted by matcher.
+    
+    The index keeps distinct values in order of first occurrence, so the first
+    accepted key is the same cell a full scan of the sheet would find.
+    
+    Args:
+        index: Result of build_sheet_value_index
+        target_normalized: Normalized value to search for
+        matcher: Comparator from _get_matcher
+    
+    Returns:
+        Match details if found, None otherwise
+    """
+    if not target_normalized:
+        return None
+    for normalized, match_info in index.items():
+        if matcher(target_normalized, normalized):
+            return match_info
+    return None
+
+
 def search_dbf_values_in_sheets(
     drive_service,
     sheets_service,
-    dbf_values: Union[List[Any], List[Dict[str, Any]]],
+    dbf_values: Iterable[Union[Any, Dict[str, Any]]],
     spreadsheet_id: str,
     mode: str = 'exact',
     sheet_names: Optional[List[str]] = None,
@@ -512,7 +764,8 @@ def search_dbf_values_in_sheets(
     Args:
         drive_service: Google Drive service instance
         sheets_service: Google Sheets service instance
-        dbf_values: List of values or dicts with {'value', 'stawka', 'czesci'} from DBF to search for
+        dbf_values: Values or dicts with {'value', 'stawka', 'czesci'} from DBF to search for
+                    (any iterable, e.g. iter_dbf_records_with_extra_fields; consumed once)
         spreadsheet_id: ID of the spreadsheet to search in
         mode: Comparison mode - 'exact' or 'substring'
         sheet_names: Optional list of sheet names to search (None = all sheets)
@@ -556,22 +809,26 @@ def search_dbf_values_in_sheets(
         # Search all sheets
         sheets_to_search = all_sheets
     
-    logger.info(f"Searching {len(dbf_values)} DBF values in {len(sheets_to_search)} sheets")
-    
-    # Load all sheet data upfront
-    sheet_data = {}
-    for sheet in sheets_to_search:
-        sheet_name = sheet['properties']['title']
-        try:
-            result = sheets_service.spreadsheets().values().get(
-                spreadsheetId=spreadsheet_id,
-                range=sheet_name,
-                majorDimension='ROWS'
-            ).execute()
-            sheet_data[sheet_name] = result.get('values', [])
-        except Exception as e:
-            logger.warning(f"Error loading sheet '{sheet_name}': {e}")
-            sheet_data[sheet_name] = []
+    logger.info(f"Searching DBF values in {len(sheets_to_search)} sheets")
+    
+    # Load all sheet data upfront (one batchGet request for several sheets;
+    # sheets that cannot be loaded are searched as empty)
+    sheet_titles = [sheet['properties']['title'] for sheet in sheets_to_search]
+    if len(sheet_titles) > 1:
+        sheet_data = get_sheet_data_many(sheets_service, spreadsheet_id, sheet_titles)
+    else:
+        sheet_data = {
+            sheet_name: get_sheet_data(sheets_service, spreadsheet_id, sheet_name)
+            for sheet_name in sheet_titles
+        }
+    
+    # Index each sheet once: in exact mode every DBF value is a dictionary lookup,
+    # in substring mode it is a scan over distinct cell values instead of all cells
+    sheet_indexes = {
+        sheet_name: build_sheet_value_index(values, sheet_name, column_names, header_row_index)
+        for sheet_name, values in sheet_data.items()
+    }
+    matcher = _get_matcher(mode)
     
     # Search each DBF value
     results = []
@@ -590,17 +847,23 @@ def search_dbf_values_in_sheets(
         
         found = False
         match_info = None
+        target_normalized = normalize_value_for_comparison(dbf_value, mode)
         
         # Search in each sheet until found
         for sheet_name in sheet_data:
-            match_info = search_value_in_sheet_data(
-                target_value=dbf_value,
-                sheet_values=sheet_data[sheet_name],
-                sheet_name=sheet_name,
-                mode=mode,
-                column_names=column_names,
-                header_row_index=header_row_index
-            )
+            if dbf_value is not None and mode != 'substring':
+                match_info = sheet_indexes[sheet_name].get(target_normalized)
+            elif dbf_value is not None:
+                match_info = _find_in_sheet_index(sheet_indexes[sheet_name], target_normalized, matcher)
+            else:
+                match_info = search_value_in_sheet_data(
+                    target_value=dbf_value,
+                    sheet_values=sheet_data[sheet_name],
+                    sheet_name=sheet_name,
+                    mode=mode,
+                    column_names=column_names,
+                    header_row_index=header_row_index
+                )
             
             if match_info:
                 found = True
@@ -705,20 +968,11 @@ def get_quadra_table_headers(
         >>> get_quadra_table_headers(['Sheet', 'Payer', 'Number', 'Rate', 'Parts', 'Status', 'Column', 'Row', 'Notes'])
         ['Sheet', 'Payer', 'Number', 'Rate', 'Parts', 'Status', 'Column', 'Row', 'Notes']
     """
-    # Default headers (Polish names used in GUI)
-    default_headers = [
-        'Arkusz',       # Sheet name
-        'Płatnik',      # Payer
-        'Numer z DBF',  # DBF Number
-        'Stawka',       # Rate
-        'Czesci',       # Parts
-        'Status',       # Status (Found/Missing)
-        'Kolumna',      # Column name
-        'Wiersz',       # Row number
-        'Uwagi'         # Notes
-    ]
+    # No mapping configured (None, {} or []) - the common case
+    if not column_names:
+        return list(QUADRA_TABLE_HEADERS)
     
-    return map_column_names(default_headers, column_names)
+    return map_column_names(list(QUADRA_TABLE_HEADERS), column_names)
 
 
 def map_column_names(
@@ -752,62 +1006,49 @@ def map_column_names(
     if isinstance(column_names_option, dict):
         # Map using dictionary: original -> display name
         # Use normalization for matching to be case-insensitive and handle whitespace
-        normalized_mapping = {}
-        for key, value in column_names_option.items():
-            # Normalize the key for matching: trim and lowercase
-            normalized_key = normalize_header_name(key)
-            normalized_mapping[normalized_key] = value
-        
-        result = []
-        for col in original_columns:
-            normalized_col = normalize_header_name(col)
-            # Check if there's a mapping for this column (case-insensitive)
-            if normalized_col in normalized_mapping:
-                result.append(normalized_mapping[normalized_col])
-            else:
-                # No mapping found, use original
-                result.append(col)
-        return result
+        # (keys normalized once, then one dict probe per column; unmapped keep original name)
+        normalized_mapping = {
+            normalize_header_name(key): value
+            for key, value in column_names_option.items()
+        }
+        return [
+            normalized_mapping.get(normalize_header_name(col), col)
+            for col in original_columns
+        ]
     
     elif isinstance(column_names_option, list):
         # Use list in order, fallback to original if not enough elements
-        mapped = []
-        for i, col in enumerate(original_columns):
-            if i < len(column_names_option):
-                mapped.append(column_names_option[i])
-            else:
-                mapped.append(col)
-        return mapped
+        count = len(original_columns)
+        return column_names_option[:count] + list(original_columns[len(column_names_option):])
     
     # Fallback: return original if invalid type
     return original_columns
 
 
-def export_quadra_results_to_json(
-    results: List[Dict[str, Any]],
+def iter_quadra_results_for_json(
+    results: Iterable[Dict[str, Any]],
     column_names: Optional[Union[Dict[str, str], List[str]]] = None
-) -> List[Dict[str, Any]]:
+) -> Iterator[Dict[str, Any]]:
     """
-    Format Quadra results for JSON export.
+    Yield Quadra results formatted for JSON export, one dictionary at a time.
     
     Args:
-        results: List of result dictionaries from search_dbf_values_in_sheets
+        results: Result dictionaries from search_dbf_values_in_sheets
         column_names: Optional custom column names mapping:
             - Dict[str, str]: Maps original key -> display name
             - List[str]: Display names in order matching default keys
             - None: Use default key names
     
-    Returns:
-        List of dictionaries ready for JSON serialization
+    Yields:
+        Dictionaries ready for JSON serialization
     """
     # Define default keys in order
     default_keys = ['dbfValue', 'stawka', 'status', 'sheetName', 'columnName', 
                     'columnIndex', 'rowIndex', 'matchedValue', 'czesci', 'notes']
     
-    # Map keys to display names
-    mapped_keys = map_column_names(default_keys, column_names)
+    # Map keys to display names once; (display name, original key) pairs reused for every row
+    key_pairs = tuple(zip(map_column_names(default_keys, column_names), default_keys))
     
-    export_list = []
     for result in results:
         # Build result dict with original keys
         result_data = {
@@ -825,37 +1066,96 @@ def export_quadra_results_to_json(
         
         # Apply column name mapping if provided
         if column_names is not None:
-            export_obj = {}
-            for i, orig_key in enumerate(default_keys):
-                mapped_key = mapped_keys[i]
-                export_obj[mapped_key] = result_data[orig_key]
+            export_obj = {mapped_key: result_data[orig_key] for mapped_key, orig_key in key_pairs}
         else:
             export_obj = result_data
         
-        export_list.append(export_obj)
-    
-    return export_list
+        yield export_obj
 
 
-def export_quadra_results_to_csv(
+def export_quadra_results_to_json(
     results: List[Dict[str, Any]],
     column_names: Optional[Union[Dict[str, str], List[str]]] = None
-) -> str:
+) -> List[Dict[str, Any]]:
     """
-    Format Quadra results for CSV export.
+    Format Quadra results for JSON export.
     
     Args:
         results: List of result dictionaries from search_dbf_values_in_sheets
+        column_names: Optional custom column names mapping:
+            - Dict[str, str]: Maps original key -> display name
+            - List[str]: Display names in order matching default keys
+            - None: Use default key names
+    
+    Returns:
+        List of dictionaries ready for JSON serialization
+    """
+    return list(iter_quadra_results_for_json(results, column_names))
+
+
+# Shared encoder with the same formatting as json.dump(..., ensure_ascii=False, indent=2)
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def export_quadra_results_to_json_stream(
+    results: Iterable[Dict[str, Any]],
+    fp: TextIO,
+    column_names: Optional[Union[Dict[str, str], List[str]]] = None
+) -> int:
+    """
+    Write Quadra results to a text file as a JSON array.
+    
+    The output is identical to json.dump(export_quadra_results_to_json(...), fp,
+    ensure_ascii=False, indent=2), but results are encoded and written one at a
+    time, so no list of export dictionaries or complete JSON string is built in memory.
+    
+    Args:
+        results: Result dictionaries from search_dbf_values_in_sheets
+        fp: Writable text file object
+        column_names: Optional custom column names mapping (as in export_quadra_results_to_json)
+    
+    Returns:
+        Number of results written
+    """
+    count = 0
+    fp.write('[')
+    for export_obj in iter_quadra_results_for_json(results, column_names):
+        # Indent each object one level inside the array (encoded strings never contain raw newlines)
+        fp.write(',\n  ' if count else '\n  ')
+        fp.write(_JSON_ENCODER.encode(export_obj).replace('\n', '\n  '))
+        count += 1
+    fp.write('\n]' if count else ']')
+    return count
+
+
+class _EchoBuffer:
+    """Pseudo-file for csv.writer: write() returns the formatted line instead of storing it."""
+    
+    def write(self, value: str) -> str:
+        return value
+
+
+def export_quadra_results_to_csv_iter(
+    results: Iterable[Dict[str, Any]],
+    column_names: Optional[Union[Dict[str, str], List[str]]] = None
+) -> Iterator[str]:
+    """
+    Yield Quadra results as CSV lines, header first.
+    
+    Lines are produced one at a time, so large result sets can be written to a file
+    (e.g. with f.writelines) without building the whole CSV string in memory.
+    
+    Args:
+        results: Result dictionaries from search_dbf_values_in_sheets
         column_names: Optional custom column names mapping:
             - Dict[str, str]: Maps original key -> display name
             - List[str]: Display names in order matching default headers
             - None: Use default header names
     
-    Returns:
-        CSV string with header and data rows
+    Yields:
+        CSV lines (with line terminators)
     """
-    output = io.StringIO()
-    writer = csv.writer(output)
+    writer = csv.writer(_EchoBuffer())
     
     # Define default headers
     default_headers = ['DBF_Value', 'Stawka', 'Status', 'SheetName', 'ColumnName', 
@@ -865,11 +1165,11 @@ def export_quadra_results_to_csv(
     headers = map_column_names(default_headers, column_names)
     
     # Write header
-    writer.writerow(headers)
+    yield writer.writerow(headers)
     
     # Write data
     for result in results:
-        writer.writerow([
+        yield writer.writerow((
             str(result['dbfValue']),
             result.get('stawka', ''),
             'Found' if result['found'] else 'Missing',
@@ -880,9 +1180,86 @@ def export_quadra_results_to_csv(
             str(result.get('matchedValue', '')) if result.get('matchedValue') is not None else '',
             result.get('czesci', ''),
             result.get('notes', '')
-        ])
+        ))
+
+
+def export_quadra_results_to_csv(
+    results: List[Dict[str, Any]],
+    column_names: Optional[Union[Dict[str, str], List[str]]] = None
+) -> str:
+    """
+    Format Quadra results for CSV export.
+    
+    Args:
+        results: List of result dictionaries from search_dbf_values_in_sheets
+        column_names: Optional custom column names mapping:
+            - Dict[str, str]: Maps original key -> display name
+            - List[str]: Display names in order matching default headers
+            - None: Use default header names
     
-    return output.getvalue()
+    Returns:
+        CSV string with header and data rows
+    """
+    return ''.join(export_quadra_results_to_csv_iter(results, column_names))
+
+
+# {spreadsheet_id: {sheet title: sheetId}} - metadata fetched once per spreadsheet,
+# least recently used spreadsheets are dropped above _SHEET_IDS_CACHE_SIZE
+_SHEET_IDS_CACHE_SIZE = 128
+_sheet_ids_cache: 'OrderedDict[str, Dict[str, int]]' = OrderedDict()
+
+
+def _get_sheet_ids(sheets_service, spreadsheet_id: str, refresh: bool = False) -> Dict[str, int]:
+    """Return {sheet title: sheetId}, fetching spreadsheet metadata only on first use or refresh."""
+    sheet_ids = None if refresh else _sheet_ids_cache.get(spreadsheet_id)
+    if sheet_ids is None:
+        metadata = sheets_service.spreadsheets().get(
+            spreadsheetId=spreadsheet_id,
+            fields='sheets(properties(sheetId,title))'
+        ).execute()
+        sheet_ids = {
+            sheet['properties']['title']: sheet['properties']['sheetId']
+            for sheet in metadata.get('sheets', [])
+        }
+        _sheet_ids_cache[spreadsheet_id] = sheet_ids
+    _sheet_ids_cache.move_to_end(spreadsheet_id)
+    while len(_sheet_ids_cache) > _SHEET_IDS_CACHE_SIZE:
+        _sheet_ids_cache.popitem(last=False)
+    return sheet_ids
+
+
+def _find_sheet_ids(sheets_service, spreadsheet_id: str, sheet_names: Iterable[str]) -> Dict[str, int]:
+    """Return cached sheet IDs, refetching metadata once if a sheet is missing (added or renamed)."""
+    sheet_ids = _get_sheet_ids(sheets_service, spreadsheet_id)
+    if any(name not in sheet_ids for name in sheet_names):
+        sheet_ids = _get_sheet_ids(sheets_service, spreadsheet_id, refresh=True)
+    return sheet_ids
+
+
+def invalidate_spreadsheet_cache(spreadsheet_id: Optional[str] = None) -> None:
+    """
+    Forget cached sheet metadata used by the Quadra sheet writers.
+    
+    Args:
+        spreadsheet_id: Spreadsheet to forget (None = all spreadsheets)
+    """
+    if spreadsheet_id is None:
+        _sheet_ids_cache.clear()
+    else:
+        _sheet_ids_cache.pop(spreadsheet_id, None)
+
+
+def _build_quadra_sheet_values(results: List[Dict[str, Any]]) -> List[List[Any]]:
+    """Build the values for columns I and J: header row followed by one row per result."""
+    # [[header_I, header_J], [row1_I, row1_J], [row2_I, row2_J], ...]
+    values = [
+        ['Stawka', 'Czesci']  # Header row
+    ]
+    for result in results:
+        stawka = result.get('stawka', '') or ''
+        czesci = result.get('czesci', '') or ''
+        values.append([stawka, czesci])
+    return values
 
 
 def write_quadra_results_to_sheet(
@@ -913,6 +1290,7 @@ def write_quadra_results_to_sheet(
         - Column I (index 8): Stawka
         - Column J (index 9): Czesci
         - Preserves existing data in other columns
+        - To write several sheets use write_quadra_results_to_sheets (one request)
     """
     if not results:
         logger.warning("No results to write to sheet")
@@ -920,16 +1298,7 @@ def write_quadra_results_to_sheet(
     
     # Get sheet ID
     try:
-        metadata = sheets_service.spreadsheets().get(
-            spreadsheetId=spreadsheet_id,
-            fields='sheets(properties(sheetId,title))'
-        ).execute()
-        
-        sheet_id = None
-        for sheet in metadata.get('sheets', []):
-            if sheet['properties']['title'] == sheet_name:
-                sheet_id = sheet['properties']['sheetId']
-                break
+        sheet_id = _find_sheet_ids(sheets_service, spreadsheet_id, [sheet_name]).get(sheet_name)
         
         if sheet_id is None:
             raise ValueError(f"Sheet '{sheet_name}' not found in spreadsheet")
@@ -941,16 +1310,7 @@ def write_quadra_results_to_sheet(
     # Prepare data for columns I and J
     # Column I (index 8): Stawka
     # Column J (index 9): Czesci
-    
-    # Build values array: [[header_I, header_J], [row1_I, row1_J], [row2_I, row2_J], ...]
-    values = [
-        ['Stawka', 'Czesci']  # Header row
-    ]
-    
-    for result in results:
-        stawka = result.get('stawka', '') or ''
-        czesci = result.get('czesci', '') or ''
-        values.append([stawka, czesci])
+    values = _build_quadra_sheet_values(results)
     
     # Write to columns I and J starting at start_row
     # A1 notation: I{start_row}:J{start_row + len(results)}
@@ -976,3 +1336,67 @@ def write_quadra_results_to_sheet(
     except Exception as e:
         logger.error(f"Error writing results to sheet: {e}")
         raise
+
+
+def write_quadra_results_to_sheets(
+    sheets_service,
+    spreadsheet_id: str,
+    sheet_results: Union[Dict[str, List[Dict[str, Any]]], List[Tuple[str, List[Dict[str, Any]]]]],
+    start_row: int = 1
+) -> None:
+    """
+    Write Quadra results to several sheets with a single values().batchUpdate request.
+    
+    Each sheet gets the same columns I (Stawka) and J (Czesci) as in
+    write_quadra_results_to_sheet, but all sheets are written in one HTTP request
+    (one write against the Sheets API quota instead of one per sheet).
+    
+    Args:
+        sheets_service: Google Sheets service instance
+        spreadsheet_id: ID of the spreadsheet
+        sheet_results: Results grouped by sheet - dict {sheet_name: results} or list of
+                       (sheet_name, results) pairs; sheets without results are skipped
+        start_row: Row number to start writing data in every sheet (1-based, default=1)
+    
+    Raises:
+        ValueError: If any of the sheets is not found (nothing is written)
+    """
+    if isinstance(sheet_results, dict):
+        sheet_results = sheet_results.items()
+    sheet_results = [(name, results) for name, results in sheet_results if results]
+    if not sheet_results:
+        logger.warning("No results to write to sheets")
+        return
+    
+    # Check all sheets before writing anything
+    try:
+        sheet_ids = _find_sheet_ids(sheets_service, spreadsheet_id, [name for name, _ in sheet_results])
+        missing = [name for name, _ in sheet_results if name not in sheet_ids]
+        if missing:
+            raise ValueError(f"Sheets not found in spreadsheet: {', '.join(missing)}")
+    except Exception as e:
+        logger.error(f"Error getting sheet metadata: {e}")
+        raise
+    
+    data = [
+        {
+            'range': f"{sheet_name}!I{start_row}:J{start_row + len(results)}",
+            'values': _build_quadra_sheet_values(results)
+        }
+        for sheet_name, results in sheet_results
+    ]
+    
+    try:
+        result = sheets_service.spreadsheets().values().batchUpdate(
+            spreadsheetId=spreadsheet_id,
+            body={'valueInputOption': 'RAW', 'data': data}
+        ).execute()
+        
+        logger.info(
+            f"Wrote {result.get('totalUpdatedCells', 0)} cells to {len(data)} sheets "
+            f"in one batch request"
+        )
+        
+    except Exception as e:
+        logger.error(f"Error writing results to sheets: {e}")
+        raise
@@ -35,13 +35,29 @@ import logging
 import re
 import threading
 from collections import Counter
-from typing import List, Dict, Any, Generator, Optional, Union, Tuple
+from functools import lru_cache
+from itertools import zip_longest
+from typing import List, Dict, Any, Generator, Optional, Union, Tuple, NamedTuple, FrozenSet, Sequence
 
 # Konfiguracja loggera dla modułu
 logger = logging.getLogger(__name__)
 
 
 # helpers
+def _compute_col_label(n: int) -> str:
+    """Wylicza etykietę A1 dla nieujemnego indeksu kolumny 0-based (0 -> A, 26 -> AA)."""
+    s = ""
+    n += 1
+    while n > 0:
+        n, r = divmod(n - 1, 26)
+        s = chr(65 + r) + s
+    return s
+
+
+# Etykiety kolumn A..ZZ (702 kolumny) wyliczone raz - adres jest liczony dla każdego wyniku
+_COL_LABELS = tuple(_compute_col_label(n) for n in range(702))
+
+
 def col_index_to_a1(n: Union[int, None]) -> str:
     """Konwertuje indeks kolumny 0-based na etykietę A1 (0 -> A).
     Zwraca '?' jeśli n jest None lub nieprawidłowy.
@@ -54,12 +70,9 @@ def col_index_to_a1(n: Union[int, None]) -> str:
         return "?"
     if n < 0:
         return "?"
-    s = ""
-    n += 1
-    while n > 0:
-        n, r = divmod(n - 1, 26)
-        s = chr(65 + r) + s
-    return s
+    if n < len(_COL_LABELS):
+        return _COL_LABELS[n]
+    return _compute_col_label(n)
 
 
 def cell_address(row_idx: Union[int, None], col_idx: Union[int, None]) -> str:
@@ -113,36 +126,40 @@ COLUMN_BLACKLIST = ['transport', 'uwagi', 'komentarz', 'komentarze', 'notatki',
 # Specjalne wartości dla search_column_name wskazujące przeszukiwanie wszystkich kolumn
 ALL_COLUMNS_VALUES = ['all', 'wszystkie']
 
+# Liczba zakładek pobieranych jednym zapytaniem batchGet w search_in_spreadsheet
+# (mniej zapytań vs. szybszy pierwszy wynik i reakcja na stop_event)
+SHEETS_PER_BATCH = 5
+
 
-def parse_header_rows(header_rows_input: Optional[str]) -> List[int]:
+def parse_header_rows(header_rows_input: Optional[str]) -> Tuple[int, ...]:
     """
     Parsuje konfigurację wierszy nagłówkowych z pola "Header rows".
     
     Obsługuje wartości oddzielone przecinkami (np. "1", "1,2", "1, 2, 3").
-    Zwraca listę indeksów wierszy 0-based.
+    Zwraca krotkę indeksów wierszy 0-based (niemutowalną i hashowalną).
     
     Args:
         header_rows_input: String z numerami wierszy (1-based) oddzielonymi przecinkami
                           lub None/pusty string (domyślnie wiersz 1)
     
     Returns:
-        Lista indeksów wierszy 0-based (np. [0] dla "1", [0, 1] dla "1,2")
-        Zwraca [0] jeśli input jest None lub nieprawidłowy
+        Krotka indeksów wierszy 0-based (np. (0,) dla "1", (0, 1) dla "1,2")
+        Zwraca (0,) jeśli input jest None lub nieprawidłowy
     
     Examples:
         >>> parse_header_rows("1")
-        [0]
+        (0,)
         >>> parse_header_rows("1,2")
-        [0, 1]
+        (0, 1)
         >>> parse_header_rows("1, 2, 3")
-        [0, 1, 2]
+        (0, 1, 2)
         >>> parse_header_rows(None)
-        [0]
+        (0,)
         >>> parse_header_rows("")
-        [0]
+        (0,)
     """
     if not header_rows_input or not header_rows_input.strip():
-        return [0]  # Default: row 1 (0-based index)
+        return (0,)  # Default: row 1 (0-based index)
     
     indices = []
     for part in header_rows_input.split(','):
@@ -156,7 +173,7 @@ def parse_header_rows(header_rows_input: Optional[str]) -> List[int]:
                 continue
     
     # If no valid indices found, return default
-    return indices if indices else [0]
+    return tuple(indices) if indices else (0,)
 
 
 def combine_header_values(values: List[List[Any]], header_row_indices: List[int]) -> List[str]:
@@ -181,34 +198,22 @@ def combine_header_values(values: List[List[Any]], header_row_indices: List[int]
     if not values or not header_row_indices:
         return []
     
-    # Find maximum number of columns across all header rows
-    max_cols = 0
-    for row_idx in header_row_indices:
-        # Check bounds: row_idx must be non-negative and within values range
-        if row_idx >= 0 and row_idx < len(values):
-            max_cols = max(max_cols, len(values[row_idx]))
+    # Resolve header rows once (in the given order), skipping out-of-range indices:
+    # row_idx must be non-negative and within values range
+    num_rows = len(values)
+    header_rows = [
+        values[row_idx] or [] for row_idx in header_row_indices
+        if 0 <= row_idx < num_rows
+    ]
     
-    if max_cols == 0:
-        return []
-    
-    # Combine header values for each column
-    combined_headers = []
-    for col_idx in range(max_cols):
-        col_parts = []
-        for row_idx in header_row_indices:
-            # Check bounds: row_idx must be non-negative and within values range
-            if row_idx >= 0 and row_idx < len(values):
-                row = values[row_idx]
-                if col_idx < len(row) and row[col_idx] is not None:
-                    cell_value = str(row[col_idx]).strip()
-                    if cell_value:
-                        col_parts.append(cell_value)
-        
-        # Join with space and normalize
-        combined = ' '.join(col_parts)
-        combined_headers.append(normalize_header_name(combined))
-    
-    return combined_headers
+    # Combine header values for each column: transpose the header rows (shorter rows
+    # are padded with None up to the widest row) and join each column's cells.
+    # Cells are joined as-is: normalize_header_name collapses whitespace (so empty
+    # cells drop out) and lowercases once per column instead of once per cell.
+    return [
+        normalize_header_name(' '.join([str(cell) for cell in column if cell is not None]))
+        for column in zip_longest(*header_rows)
+    ]
 
 
 def normalize_header_name(name: Any) -> str:
@@ -226,13 +231,15 @@ def normalize_header_name(name: Any) -> str:
     """
     if name is None:
         return ""
-    s = str(name)
-    # Zamień podkreślenia na spacje
-    s = s.replace('_', ' ')
-    # Zredukuj wielokrotne spacje do jednej
-    s = ' '.join(s.split())
-    # Strip + lowercase
-    return s.strip().lower()
+    return _normalize_header_name_cached(str(name))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_header_name_cached(name: str) -> str:
+    """Normalizacja nagłówka z pamięcią podręczną (te same nagłówki powtarzają się między zakładkami)."""
+    # Zamień podkreślenia na spacje, zredukuj wielokrotne spacje do jednej
+    # (split() bez argumentów obcina też białe znaki na brzegach) i zamień na lowercase
+    return ' '.join(name.replace('_', ' ').split()).lower()
 
 
 def extract_numeric_tokens(text: str) -> List[str]:
@@ -269,9 +276,9 @@ def is_search_all_columns(search_column_name: Optional[str]) -> bool:
     return normalize_header_name(search_column_name) in ALL_COLUMNS_VALUES
 
 
-def parse_ignore_patterns(ignore_input: Optional[str]) -> List[str]:
+def parse_ignore_patterns(ignore_input: Optional[str]) -> Tuple[str, ...]:
     """
-    Parsuje pole 'Ignoruj' na listę wzorców ignorowania.
+    Parsuje pole 'Ignoruj' na krotkę wzorców ignorowania.
     
     Obsługuje wiele wartości oddzielonych przecinkami, średnikami lub nowymi liniami.
     Każda wartość jest normalizowana (trim + lowercase).
@@ -280,21 +287,32 @@ def parse_ignore_patterns(ignore_input: Optional[str]) -> List[str]:
         ignore_input: Tekst z pola Ignoruj (może być None lub pusty)
     
     Returns:
-        Lista znormalizowanych wzorców ignorowania (pusta lista jeśli brak)
+        Krotka znormalizowanych wzorców ignorowania (pusta jeśli brak);
+        niemutowalna, więc wynik z cache może być zwracany bez kopiowania
     
     Examples:
         >>> parse_ignore_patterns("temp, test, debug")
-        ['temp', 'test', 'debug']
+        ('temp', 'test', 'debug')
         >>> parse_ignore_patterns("temp*\\ntest\\n*debug")
-        ['temp*', 'test', '*debug']
+        ('temp*', 'test', '*debug')
         >>> parse_ignore_patterns(None)
-        []
+        ()
     """
     if not ignore_input:
-        return []
+        return ()
     
-    # Zamień średniki i nowe linie na przecinki
-    normalized = ignore_input.replace(';', ',').replace('\n', ',')
+    return _parse_ignore_patterns_cached(ignore_input)
+
+
+# Separatory pola Ignoruj zamieniane na przecinek
+_IGNORE_SEPARATORS_TABLE = str.maketrans({';': ',', '\n': ',', '\r': ','})
+
+
+@lru_cache(maxsize=128)
+def _parse_ignore_patterns_cached(ignore_input: str) -> Tuple[str, ...]:
+    """Parsuje niepusty tekst pola Ignoruj (wynik cache'owany per tekst)."""
+    # Zamień średniki i nowe linie na przecinki (jedno przejście)
+    normalized = ignore_input.translate(_IGNORE_SEPARATORS_TABLE)
     
     # Podziel na części i wyczyść
     patterns = []
@@ -304,10 +322,99 @@ def parse_ignore_patterns(ignore_input: Optional[str]) -> List[str]:
             # Normalizuj pattern (lowercase, ale zachowaj wildcards)
             patterns.append(part.lower())
     
-    return patterns
+    return tuple(patterns)
 
 
-def matches_ignore_pattern(header_name: str, ignore_patterns: List[str]) -> bool:
+class IgnorePatterns(NamedTuple):
+    """
+    Wzorce ignorowania skompilowane do grup wg rodzaju wildcardu.
+    
+    Klasyfikacja (strip + lowercase + rozpoznanie '*') odbywa się raz,
+    zamiast przy każdej sprawdzanej komórce/nagłówku.
+    
+    - prefixes: "pattern*" (startsWith)
+    - suffixes: "*pattern" (endsWith)
+    - substrings: "*pattern*" oraz "pattern" bez wildcardów (contains)
+    - exacts: zbiór substrings - wartość równa wzorcowi jest rozpoznawana
+      jednym sprawdzeniem w zbiorze, bez skanowania podciągów
+    """
+    prefixes: Tuple[str, ...]
+    suffixes: Tuple[str, ...]
+    substrings: Tuple[str, ...]
+    exacts: FrozenSet[str] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.prefixes or self.suffixes or self.substrings)
+
+
+def compile_ignore_patterns(ignore_patterns: Union[Sequence[str], IgnorePatterns, None]) -> IgnorePatterns:
+    """
+    Kompiluje wzorce ignorowania (z parse_ignore_patterns) do IgnorePatterns.
+    
+    Args:
+        ignore_patterns: Lista/krotka wzorców, już skompilowane wzorce lub None
+    
+    Returns:
+        IgnorePatterns (puste jeśli brak wzorców); skompilowane wzorce są zwracane bez zmian
+    
+    Examples:
+        >>> compiled = compile_ignore_patterns(["temp*", "*old", "*debug*", "https"])
+        >>> compiled.prefixes, compiled.suffixes, compiled.substrings
+        (('temp',), ('old',), ('debug', 'https'))
+    """
+    if isinstance(ignore_patterns, IgnorePatterns):
+        return ignore_patterns
+    return _compile_ignore_patterns_cached(tuple(ignore_patterns or ()))
+
+
+@lru_cache(maxsize=128)
+def _compile_ignore_patterns_cached(ignore_patterns: Tuple[str, ...]) -> IgnorePatterns:
+    """Kompiluje krotkę wzorców (wynik cache'owany - ta sama lista jest zwykle używana wielokrotnie)."""
+    prefixes = []
+    suffixes = []
+    substrings = []
+    for pattern in ignore_patterns or []:
+        pattern = pattern.strip().lower()
+        if not pattern:
+            continue
+        
+        if pattern.startswith('*') and pattern.endswith('*'):
+            # *pattern* - contains
+            search_term, bucket = pattern[1:-1], substrings
+        elif pattern.startswith('*'):
+            # *pattern - endsWith
+            search_term, bucket = pattern[1:], suffixes
+        elif pattern.endswith('*'):
+            # pattern* - startsWith
+            search_term, bucket = pattern[:-1], prefixes
+        else:
+            # Dopasowanie podciągu (substring match, case-insensitive)
+            search_term, bucket = pattern, substrings
+        
+        if search_term:
+            bucket.append(search_term)
+    
+    return IgnorePatterns(tuple(prefixes), tuple(suffixes), tuple(substrings), frozenset(substrings))
+
+
+def _matches_compiled_ignore(normalized_text: str, compiled: IgnorePatterns) -> bool:
+    """Sprawdza znormalizowany tekst względem skompilowanych wzorców ignorowania."""
+    substrings = compiled.substrings
+    if len(substrings) == 1 and not compiled.prefixes and not compiled.suffixes:
+        # Najczęstszy przypadek: jeden wzorzec podciągu (np. "https") - jedno sprawdzenie
+        return substrings[0] in normalized_text
+    return (
+        normalized_text in compiled.exacts
+        or normalized_text.startswith(compiled.prefixes)
+        or normalized_text.endswith(compiled.suffixes)
+        or any(term in normalized_text for term in compiled.substrings)
+    )
+
+
+def matches_ignore_pattern(
+    header_name: str,
+    ignore_patterns: Union[Sequence[str], IgnorePatterns, None]
+) -> bool:
     """
     Sprawdza czy nazwa nagłówka pasuje do któregokolwiek wzorca ignorowania.
     
@@ -321,7 +428,7 @@ def matches_ignore_pattern(header_name: str, ignore_patterns: List[str]) -> bool
     
     Args:
         header_name: Nazwa nagłówka kolumny do sprawdzenia
-        ignore_patterns: Lista wzorców ignorowania
+        ignore_patterns: Lista wzorców ignorowania lub IgnorePatterns (compile_ignore_patterns)
     
     Returns:
         True jeśli nagłówek pasuje do któregokolwiek wzorca
@@ -347,36 +454,13 @@ def matches_ignore_pattern(header_name: str, ignore_patterns: List[str]) -> bool
     if not normalized_header:
         return False
     
-    for pattern in ignore_patterns:
-        pattern = pattern.strip().lower()
-        if not pattern:
-            continue
-        
-        # Obsługa wildcardów
-        if pattern.startswith('*') and pattern.endswith('*'):
-            # *pattern* - contains
-            search_term = pattern[1:-1]
-            if search_term and search_term in normalized_header:
-                return True
-        elif pattern.startswith('*'):
-            # *pattern - endsWith
-            search_term = pattern[1:]
-            if search_term and normalized_header.endswith(search_term):
-                return True
-        elif pattern.endswith('*'):
-            # pattern* - startsWith
-            search_term = pattern[:-1]
-            if search_term and normalized_header.startswith(search_term):
-                return True
-        else:
-            # Dopasowanie podciągu (substring match, case-insensitive)
-            if pattern in normalized_header:
-                return True
-    
-    return False
+    return _matches_compiled_ignore(normalized_header, compile_ignore_patterns(ignore_patterns))
 
 
-def matches_ignore_value(cell_value: str, ignore_patterns: List[str]) -> bool:
+def matches_ignore_value(
+    cell_value: str,
+    ignore_patterns: Union[Sequence[str], IgnorePatterns, None]
+) -> bool:
     """
     Sprawdza czy wartość komórki pasuje do któregokolwiek wzorca ignorowania.
     
@@ -390,7 +474,7 @@ def matches_ignore_value(cell_value: str, ignore_patterns: List[str]) -> bool:
     
     Args:
         cell_value: Wartość komórki do sprawdzenia
-        ignore_patterns: Lista wzorców ignorowania
+        ignore_patterns: Lista wzorców ignorowania lub IgnorePatterns (compile_ignore_patterns)
     
     Returns:
         True jeśli wartość pasuje do któregokolwiek wzorca
@@ -417,33 +501,7 @@ def matches_ignore_value(cell_value: str, ignore_patterns: List[str]) -> bool:
     if not normalized_value:
         return False
     
-    for pattern in ignore_patterns:
-        pattern = pattern.strip().lower()
-        if not pattern:
-            continue
-        
-        # Obsługa wildcardów
-        if pattern.startswith('*') and pattern.endswith('*'):
-            # *pattern* - contains
-            search_term = pattern[1:-1]
-            if search_term and search_term in normalized_value:
-                return True
-        elif pattern.startswith('*'):
-            # *pattern - endsWith
-            search_term = pattern[1:]
-            if search_term and normalized_value.endswith(search_term):
-                return True
-        elif pattern.endswith('*'):
-            # pattern* - startsWith
-            search_term = pattern[:-1]
-            if search_term and normalized_value.startswith(search_term):
-                return True
-        else:
-            # Dopasowanie podciągu (substring match, case-insensitive)
-            if pattern in normalized_value:
-                return True
-    
-    return False
+    return _matches_compiled_ignore(normalized_value, compile_ignore_patterns(ignore_patterns))
 
 
 def get_sheet_headers(sheets_service, spreadsheet_id: str, sheet_name: str) -> List[str]:
@@ -635,10 +693,113 @@ def find_column_index_by_name(header_row: List[Any], column_name: str) -> Option
     return None
 
 
+def build_ignore_mask(
+    header_row: List[Any],
+    ignore_patterns: Union[Sequence[str], IgnorePatterns, None]
+) -> List[bool]:
+    """
+    Buduje maskę ignorowanych kolumn dla wiersza nagłówków.
+    
+    Każdy nagłówek jest normalizowany i sprawdzany względem wzorców raz,
+    więc kolejne zapytania o kolumny sprowadzają się do odczytu mask[idx].
+    
+    Args:
+        header_row: Lista wartości wiersza nagłówków
+        ignore_patterns: Lista wzorców ignorowania lub IgnorePatterns
+    
+    Returns:
+        Lista wartości bool (True = kolumna ignorowana), tej samej długości co header_row
+    """
+    if not header_row:
+        return []
+    compiled = compile_ignore_patterns(ignore_patterns)
+    if not compiled:
+        return [False] * len(header_row)
+    return [
+        cell is not None and matches_ignore_pattern(str(cell), compiled)
+        for cell in header_row
+    ]
+
+
+def build_header_index(header_row: List[Any]) -> Dict[str, List[int]]:
+    """
+    Buduje indeks: znormalizowana nazwa nagłówka -> lista indeksów kolumn (rosnąco).
+    
+    Pozwala wyszukiwać wiele nazw kolumn w tym samym wierszu nagłówków
+    bez ponownej normalizacji wszystkich nagłówków przy każdym zapytaniu.
+    
+    Args:
+        header_row: Lista wartości wiersza nagłówków
+    
+    Returns:
+        Słownik {znormalizowana_nazwa: [indeksy]} (komórki None są pomijane)
+    """
+    header_index: Dict[str, List[int]] = {}
+    for idx, cell in enumerate(header_row or []):
+        if cell is None:
+            continue
+        header_index.setdefault(normalize_header_name(cell), []).append(idx)
+    return header_index
+
+
+class HeaderContext(NamedTuple):
+    """
+    Dane pomocnicze wiersza nagłówków wyliczone w jednym przejściu (build_header_context).
+    
+    Attributes:
+        header_index: Słownik {znormalizowana_nazwa: [indeksy]} jak z build_header_index
+        ignore_mask: Lista bool (True = kolumna ignorowana) jak z build_ignore_mask
+    """
+    header_index: Dict[str, List[int]]
+    ignore_mask: List[bool]
+
+
+def build_header_context(
+    header_row: List[Any],
+    ignore_patterns: Union[Sequence[str], IgnorePatterns, None] = None
+) -> HeaderContext:
+    """
+    Buduje indeks nagłówków i maskę ignorowanych kolumn w jednym przejściu.
+    
+    Każdy nagłówek jest normalizowany dokładnie raz; znormalizowana nazwa trafia
+    do indeksu i jest od razu sprawdzana względem wzorców ignorowania (powtarzające
+    się nazwy są sprawdzane tylko przy pierwszym wystąpieniu). Wynik jest równoważny
+    wywołaniu build_header_index i build_ignore_mask osobno.
+    
+    Args:
+        header_row: Lista wartości wiersza nagłówków
+        ignore_patterns: Lista wzorców ignorowania lub IgnorePatterns
+    
+    Returns:
+        HeaderContext(header_index, ignore_mask)
+    """
+    header_row = header_row or []
+    compiled = compile_ignore_patterns(ignore_patterns)
+    header_index: Dict[str, List[int]] = {}
+    ignore_mask = [False] * len(header_row)
+    ignored_names: Dict[str, bool] = {}
+    for idx, cell in enumerate(header_row):
+        if cell is None:
+            continue
+        norm_name = normalize_header_name(cell)
+        indices = header_index.get(norm_name)
+        if indices is None:
+            header_index[norm_name] = [idx]
+            ignored_names[norm_name] = bool(
+                compiled and norm_name and _matches_compiled_ignore(norm_name, compiled)
+            )
+        else:
+            indices.append(idx)
+        ignore_mask[idx] = ignored_names[norm_name]
+    return HeaderContext(header_index, ignore_mask)
+
+
 def find_all_column_indices_by_name(
     header_row: List[Any], 
     column_name: str, 
-    ignore_patterns: Optional[List[str]] = None
+    ignore_patterns: Union[Sequence[str], IgnorePatterns, None] = None,
+    ignore_mask: Optional[List[bool]] = None,
+    header_index: Optional[Dict[str, List[int]]] = None
 ) -> List[int]:
     """
     Znajduje wszystkie indeksy kolumn pasujących do podanej nazwy (znormalizowanej, case-insensitive).
@@ -648,6 +809,12 @@ def find_all_column_indices_by_name(
         header_row: Lista wartości pierwszego wiersza (nagłówka)
         column_name: Nazwa kolumny do znalezienia
         ignore_patterns: Opcjonalna lista wzorców ignorowania (z parse_ignore_patterns)
+            lub IgnorePatterns (z compile_ignore_patterns)
+        ignore_mask: Opcjonalna maska z build_ignore_mask (dla tego samego header_row);
+            jeśli podana, zastępuje ignore_patterns - przydatne przy wielu zapytaniach
+            o kolumny w tym samym wierszu nagłówków
+        header_index: Opcjonalny indeks z build_header_index (dla tego samego header_row);
+            jeśli podany, kolumny są wyszukiwane w słowniku zamiast skanowania nagłówków
     
     Returns:
         Lista indeksów wszystkich kolumn pasujących do nazwy i nie pasujących do ignore_patterns
@@ -656,19 +823,33 @@ def find_all_column_indices_by_name(
         return []
     
     norm_target = normalize_header_name(column_name)
-    matching_indices = []
+    if ignore_mask is None and ignore_patterns:
+        ignore_patterns = compile_ignore_patterns(ignore_patterns)
     
-    for idx, cell in enumerate(header_row):
-        if cell is None:
-            continue
-        norm_cell = normalize_header_name(cell)
-        if norm_cell == norm_target:
-            # Sprawdź czy kolumna nie jest ignorowana
-            if ignore_patterns and matches_ignore_pattern(str(cell), ignore_patterns):
-                continue  # Pomiń ignorowane kolumny
-            matching_indices.append(idx)
+    if header_index is not None:
+        candidate_indices = header_index.get(norm_target, [])
+    else:
+        candidate_indices = [
+            idx for idx, cell in enumerate(header_row)
+            if cell is not None and normalize_header_name(cell) == norm_target
+        ]
+    
+    if ignore_mask is not None:
+        # Pomiń kolumny oznaczone w masce jako ignorowane
+        return [
+            idx for idx in candidate_indices
+            if not (idx < len(ignore_mask) and ignore_mask[idx])
+        ]
+    
+    # Brak wzorców ignorowania (najczęstszy przypadek) - bez filtrowania
+    if not ignore_patterns:
+        return list(candidate_indices)
     
-    return matching_indices
+    # Wszystkie kandydujące nagłówki mają tę samą znormalizowaną nazwę (norm_target),
+    # więc wzorce ignorowania sprawdzamy raz - na już znormalizowanej nazwie
+    if norm_target and _matches_compiled_ignore(norm_target, ignore_patterns):
+        return []  # Wszystkie kolumny o tej nazwie są ignorowane
+    return list(candidate_indices)
 
 
 def find_stawka_column_index(header_row: List[Any]) -> Optional[int]:
@@ -695,6 +876,10 @@ def find_stawka_column_index(header_row: List[Any]) -> Optional[int]:
     return None
 
 
+# Komórka zawierająca wyłącznie cyfry i separatory (nie wygląda jak nagłówek)
+_NUMERIC_CELL_RE = re.compile(r'^[\d\.\,\-\s]+$')
+
+
 def is_likely_header_row(row: List[Any]) -> bool:
     """
     Sprawdza czy wiersz wygląda jak nagłówek (zawiera tekst, nie tylko liczby).
@@ -707,11 +892,14 @@ def is_likely_header_row(row: List[Any]) -> bool:
         if cell is None:
             continue
         cell_str = str(cell).strip()
-        if cell_str and not re.match(r'^[\d\.\,\-\s]+$', cell_str):
+        if cell_str and not _NUMERIC_CELL_RE.match(cell_str):
             text_cells += 1
+            # Wiersz jest nagłówkiem jeśli ma co najmniej 2 komórki z tekstem -
+            # nie ma potrzeby skanować reszty (szerokich) wierszy
+            if text_cells >= 2:
+                return True
     
-    # Wiersz jest nagłówkiem jeśli ma co najmniej 2 komórki z tekstem
-    return text_cells >= 2
+    return False
 
 
 def get_cell_value_safe(row: List[Any], idx: int) -> Optional[str]:
@@ -821,6 +1009,7 @@ def search_in_spreadsheets(
     pattern_has_digits = bool(re.search(r"\d", pattern_str))
     norm_pat = normalize_number_string(pattern_str) if pattern_has_digits else ""
     digit_pattern = re.compile(r"\d")  # Pre-compiled regex for digit detection
+    pattern_lower = pattern_str.lower()  # Lowercased once for case-insensitive substring match
 
     for f in files:
         # Check stop_event before processing each file
@@ -878,7 +1067,7 @@ def search_in_spreadsheets(
                                     if pattern in cell_text:
                                         matched = True
                                 else:
-                                    if pattern.lower() in cell_text.lower():
+                                    if pattern_lower in cell_text.lower():
                                         matched = True
 
                         # 3) Jeśli nie znaleziono i pattern i cell zawierają cyfry, spróbuj dopasowania
@@ -961,26 +1150,34 @@ def search_in_spreadsheet(
         logger.error(f"Błąd pobierania metadanych arkusza [{spreadsheet_id}]: {e}")
         return
 
-    # Przeszukaj każdą zakładkę
-    for sh in sheets:
-        # Check stop_event before processing each sheet
-        if stop_event is not None and stop_event.is_set():
-            return
-        sheet_name = sh["properties"]["title"]
-        yield from search_in_sheet(
-            drive_service,
-            sheets_service,
-            spreadsheet_id=spreadsheet_id,
-            sheet_name=sheet_name,
-            pattern=pattern,
-            regex=regex,
-            case_sensitive=case_sensitive,
-            search_column_name=search_column_name,
-            spreadsheet_name=spreadsheet_name,
-            stop_event=stop_event,
-            ignore_patterns=ignore_patterns,
-            header_row_indices=header_row_indices,
-        )
+    sheet_names = [sh["properties"]["title"] for sh in sheets]
+
+    # Pobieraj zakładki partiami po SHEETS_PER_BATCH jednym zapytaniem batchGet na partię,
+    # aby pierwsze wyniki pojawiały się przed pobraniem całego arkusza
+    for start in range(0, len(sheet_names), SHEETS_PER_BATCH):
+        batch = sheet_names[start:start + SHEETS_PER_BATCH]
+        sheet_values = get_sheet_data_many(sheets_service, spreadsheet_id, batch) if len(batch) > 1 else {}
+
+        # Przeszukaj każdą zakładkę partii
+        for sheet_name in batch:
+            # Check stop_event before processing each sheet (also right after the batch fetch)
+            if stop_event is not None and stop_event.is_set():
+                return
+            yield from search_in_sheet(
+                drive_service,
+                sheets_service,
+                spreadsheet_id=spreadsheet_id,
+                sheet_name=sheet_name,
+                pattern=pattern,
+                regex=regex,
+                case_sensitive=case_sensitive,
+                search_column_name=search_column_name,
+                spreadsheet_name=spreadsheet_name,
+                stop_event=stop_event,
+                ignore_patterns=ignore_patterns,
+                header_row_indices=header_row_indices,
+                values=sheet_values.get(sheet_name),
+            )
 
 
 def search_in_sheet(
@@ -996,6 +1193,7 @@ def search_in_sheet(
     stop_event: Optional[threading.Event] = None,
     ignore_patterns: Optional[List[str]] = None,
     header_row_indices: Optional[List[int]] = None,
+    values: Optional[List[List[Any]]] = None,
 ) -> Generator[Dict[str, Any], None, None]:
     """
     Przeszukuje tylko wybraną zakładkę w konkretnym arkuszu wg pattern.
@@ -1019,6 +1217,8 @@ def search_in_sheet(
         header_row_indices: Opcjonalna lista indeksów wierszy nagłówkowych (0-based)
             - Jeśli podana, używa tych wierszy do budowy połączonych nagłówków
             - Jeśli None, wykrywa automatycznie (wiersz 1 lub 2)
+        values: Opcjonalne, wcześniej pobrane wartości zakładki (np. z get_sheet_data_many)
+            - Jeśli podane, zakładka nie jest pobierana ponownie z API
     
     Zwraca generator wyników w formacie:
     {
@@ -1075,18 +1275,23 @@ def search_in_sheet(
     pattern_has_digits = bool(re.search(r"\d", pattern_str))
     norm_pat = normalize_number_string(pattern_str) if pattern_has_digits else ""
     digit_pattern = re.compile(r"\d")  # Pre-compiled regex for digit detection
+    pattern_lower = pattern_str.lower()  # Lowercased once for case-insensitive substring match
 
-    # Pobierz wartości z wybranej zakładki
-    try:
-        resp = sheets_service.spreadsheets().values().get(
-            spreadsheetId=spreadsheet_id,
-            range=sheet_name,
-            majorDimension="ROWS"
-        ).execute()
-        values = resp.get("values", [])
-    except Exception as e:
-        logger.error(f"Błąd pobierania danych z arkusza [{spreadsheet_name}] {sheet_name}: {e}")
-        return
+    # Skompiluj wzorce ignorowania raz dla całej zakładki
+    ignore_patterns = compile_ignore_patterns(ignore_patterns) if ignore_patterns else None
+
+    # Pobierz wartości z wybranej zakładki (chyba że zostały już pobrane)
+    if values is None:
+        try:
+            resp = sheets_service.spreadsheets().values().get(
+                spreadsheetId=spreadsheet_id,
+                range=sheet_name,
+                majorDimension="ROWS"
+            ).execute()
+            values = resp.get("values", [])
+        except Exception as e:
+            logger.error(f"Błąd pobierania danych z arkusza [{spreadsheet_name}] {sheet_name}: {e}")
+            return
 
     if not values:
         return
@@ -1104,10 +1309,19 @@ def search_in_sheet(
     
     if not search_all and search_column_name is not None:
         # Szukamy konkretnej kolumny - znajdź WSZYSTKIE kolumny o tej nazwie (z filtrowaniem ignorowanych)
-        target_col_indices = find_all_column_indices_by_name(header_row, search_column_name, ignore_patterns) if header_row else []
+        # Nagłówki są normalizowane raz (razem z maską ignorowania) i współdzielone
+        # przez oba wyszukiwania poniżej
+        header_context = build_header_context(header_row, ignore_patterns)
+        target_col_indices = find_all_column_indices_by_name(
+            header_row, search_column_name,
+            ignore_mask=header_context.ignore_mask,
+            header_index=header_context.header_index,
+        ) if header_row else []
         if not target_col_indices:
             # Kolumna nie istnieje lub wszystkie są ignorowane
-            if header_row and find_all_column_indices_by_name(header_row, search_column_name, None):
+            if header_row and find_all_column_indices_by_name(
+                header_row, search_column_name, None, header_index=header_context.header_index
+            ):
                 logger.debug(f"Wszystkie kolumny '{search_column_name}' są ignorowane w [{spreadsheet_name}] {sheet_name}")
             else:
                 logger.debug(f"Kolumna '{search_column_name}' nie istnieje w [{spreadsheet_name}] {sheet_name}")
@@ -1127,44 +1341,45 @@ def search_in_sheet(
 
     def check_match(cell_text: str) -> bool:
         """Sprawdza czy komórka pasuje do wzorca."""
-        matched = False
+        cell_text_lower = None
         # 1) regex match jeśli wybrano regex
         if regex:
             try:
                 if matcher and matcher.search(cell_text):
-                    matched = True
+                    return True
             except re.error:
-                matched = False
-        else:
-            # 2) zwykły substring (case-sensitive lub nie)
-            if pattern and cell_text:
-                if case_sensitive:
-                    if pattern in cell_text:
-                        matched = True
-                else:
-                    if pattern.lower() in cell_text.lower():
-                        matched = True
+                pass
+        elif pattern and cell_text:
+            # 2) zwykły substring (case-sensitive lub nie) - bez regex, przez operator 'in'
+            if case_sensitive:
+                if pattern in cell_text:
+                    return True
+            else:
+                cell_text_lower = cell_text.lower()
+                if pattern_lower in cell_text_lower:
+                    return True
+
+        if not pattern_has_digits:
+            return False
 
         # 3) Jeśli nie znaleziono i pattern i cell zawierają cyfry, spróbuj dopasowania
         #    po normalizacji liczb (usuń separatory tysięcy, NBSP itp.)
-        if not matched and pattern_has_digits:
-            if digit_pattern.search(cell_text):
-                norm_cell = normalize_number_string(cell_text)
-                if norm_pat and norm_pat in norm_cell:
-                    matched = True
+        if digit_pattern.search(cell_text):
+            norm_cell = normalize_number_string(cell_text)
+            if norm_pat and norm_pat in norm_cell:
+                return True
         
         # 4) Dla URL-ów: wyciągnij tokeny numeryczne i sprawdź
-        if not matched and pattern_has_digits:
+        #    (tekst w lowercase liczony raz - współdzielony z krokiem 2)
+        if cell_text_lower is None:
             cell_text_lower = cell_text.lower()
-            if 'http://' in cell_text_lower or 'https://' in cell_text_lower or 'www.' in cell_text_lower:
-                numeric_tokens = extract_numeric_tokens(cell_text)
-                for token in numeric_tokens:
-                    norm_token = normalize_number_string(token)
-                    if norm_pat and norm_pat in norm_token:
-                        matched = True
-                        break
+        if 'http://' in cell_text_lower or 'https://' in cell_text_lower or 'www.' in cell_text_lower:
+            for token in extract_numeric_tokens(cell_text):
+                norm_token = normalize_number_string(token)
+                if norm_pat and norm_pat in norm_token:
+                    return True
         
-        return matched
+        return False
 
     def get_stawka_for_row(row: List[Any], match_col_idx: int) -> str:
         """Pobiera wartość stawki dla wiersza."""
@@ -1179,6 +1394,9 @@ def search_in_sheet(
 
     if search_all:
         # Tryb 'ALL' - przeszukuj wszystkie kolumny (z pominięciem ignorowanych)
+        # Maska ignorowanych kolumn jest liczona raz dla nagłówka, nie dla każdej komórki
+        ignore_mask = build_ignore_mask(header_row, ignore_patterns) if ignore_patterns and header_row else []
+        ignore_mask_len = len(ignore_mask)
         for r_idx in range(start_row, len(values)):
             # Check stop_event periodically during row iteration
             if stop_event is not None and stop_event.is_set():
@@ -1189,9 +1407,8 @@ def search_in_sheet(
             for c_idx, cell in enumerate(row):
                 try:
                     # Sprawdź czy kolumna nie jest ignorowana
-                    if header_row and c_idx < len(header_row) and ignore_patterns:
-                        if matches_ignore_pattern(str(header_row[c_idx]), ignore_patterns):
-                            continue  # Pomiń ignorowane kolumny
+                    if c_idx < ignore_mask_len and ignore_mask[c_idx]:
+                        continue  # Pomiń ignorowane kolumny
                     
                     # Obsługa None i konwersja do str
                     if cell is None:
@@ -1431,6 +1648,8 @@ def find_duplicates_in_sheet(
     
     # Detect duplicates separately in each matching column
     all_duplicates = []
+    # Znormalizowane wartości współdzielone przez wszystkie kolumny: surowa wartość -> znormalizowana
+    normalized_cache: Dict[str, str] = {}
     
     for target_col_idx in target_col_indices:
         # Map normalized values to their occurrences: normalized_value -> [(row_index_1based, raw_value), ...]
@@ -1453,22 +1672,23 @@ def find_duplicates_in_sheet(
                 
                 raw_value = cell_value
                 
-                # Normalizuj wartość
+                # Normalizuj wartość (każda różna wartość tylko raz)
                 if normalize:
-                    # Dla liczb użyj normalize_number_string
-                    normalized = normalize_number_string(cell_value)
-                    if not normalized:
-                        # Dla tekstu: strip + lowercase
-                        normalized = cell_value.strip().lower()
+                    normalized = normalized_cache.get(cell_value)
+                    if normalized is None:
+                        # Dla liczb użyj normalize_number_string
+                        normalized = normalize_number_string(cell_value)
+                        if not normalized:
+                            # Dla tekstu: strip + lowercase
+                            normalized = cell_value.strip().lower()
+                        normalized_cache[cell_value] = normalized
                 else:
                     normalized = cell_value
                 
                 # 1-based row index (API zwraca 0-based, ale wyświetlamy 1-based)
                 row_1based = r_idx + 1
                 
-                if normalized not in value_occurrences:
-                    value_occurrences[normalized] = []
-                value_occurrences[normalized].append((row_1based, raw_value))
+                value_occurrences.setdefault(normalized, []).append((row_1based, raw_value))
                 
             except Exception as e:
                 logger.warning(
@@ -1652,3 +1872,42 @@ def get_sheet_data(sheets_service, spreadsheet_id: str, sheet_name: str) -> List
     except Exception as e:
         logger.error(f"Error getting data from [{spreadsheet_id}] {sheet_name}: {e}")
         return []
+
+
+def get_sheet_data_many(sheets_service, spreadsheet_id: str, sheet_names: List[str]) -> Dict[str, List[List[Any]]]:
+    """
+    Get all data from several sheets of one spreadsheet.
+    
+    Fetches all sheets with a single values().batchGet request instead of one
+    request per sheet. The API client is not thread-safe, so batching is used
+    rather than parallel get_sheet_data calls. If batchGet fails, falls back
+    to get_sheet_data for each sheet.
+    
+    Args:
+        sheets_service: Google Sheets API service object
+        spreadsheet_id: ID of the spreadsheet
+        sheet_names: Names of the sheets
+    
+    Returns:
+        Dictionary mapping sheet name to 2D list of its data (including headers)
+    """
+    if not sheet_names:
+        return {}
+    try:
+        resp = sheets_service.spreadsheets().values().batchGet(
+            spreadsheetId=spreadsheet_id,
+            ranges=list(sheet_names),
+            majorDimension="ROWS"
+        ).execute()
+        value_ranges = resp.get("valueRanges", [])
+        # valueRanges are returned in the same order as the requested ranges
+        return {
+            sheet_name: (value_ranges[i].get("values", []) if i < len(value_ranges) else [])
+            for i, sheet_name in enumerate(sheet_names)
+        }
+    except Exception as e:
+        logger.warning(f"Batch fetch failed for [{spreadsheet_id}], fetching sheets one by one: {e}")
+        return {
+            sheet_name: get_sheet_data(sheets_service, spreadsheet_id, sheet_name)
+            for sheet_name in sheet_names
+        }
@@ -5,7 +5,7 @@ Unit tests for column name mapping feature in main.py
 
 import unittest
 import json
-from main import parse_column_names_arg, map_result_keys
+from main import parse_column_names_arg, map_result_keys, build_renamer, build_result_renamer
 
 
 class TestParseColumnNamesArg(unittest.TestCase):
@@ -119,12 +119,9 @@ class TestMapResultKeys(unittest.TestCase):
         
         mapped = map_result_keys(result, column_names)
         
-        self.assertIn('ID', mapped)
-        self.assertIn('Nazwa', mapped)
-        self.assertIn('Zakładka', mapped)
-        self.assertIn('Komórka', mapped)
-        self.assertIn('Wartość', mapped)
-        self.assertIn('Stawka', mapped)
+        self.assertGreaterEqual(
+            mapped.keys(), {'ID', 'Nazwa', 'Zakładka', 'Komórka', 'Wartość', 'Stawka'}
+        )
         self.assertEqual(mapped['ID'], '123')
         self.assertEqual(mapped['Nazwa'], 'Test Sheet')
         self.assertEqual(mapped['Zakładka'], 'Sheet1')
@@ -185,6 +182,26 @@ class TestMapResultKeys(unittest.TestCase):
         self.assertIn('anotherField', mapped)
         self.assertEqual(mapped['customField'], 'custom value')
 
+    def test_build_renamer_reused_for_equal_column_names(self):
+        """Test that equal column_names share one cached renamer."""
+        renamer = build_renamer(['ID', 'Nazwa'])
+        
+        self.assertIs(renamer, build_renamer(['ID', 'Nazwa']))
+        self.assertIs(build_renamer({'cell': 'Komórka'}), build_renamer({'cell': 'Komórka'}))
+        self.assertIs(
+            build_renamer({'cell': 'Komórka', 'stawka': 'Stawka'}),
+            build_renamer({'stawka': 'Stawka', 'cell': 'Komórka'})
+        )
+        self.assertEqual(
+            renamer({'spreadsheetId': '1', 'spreadsheetName': 'A', 'cell': 'B2'}),
+            {'ID': '1', 'Nazwa': 'A', 'cell': 'B2'}
+        )
+    
+    def test_build_renamer_with_none_is_identity(self):
+        """Test that renamer for None returns result unchanged."""
+        result = {'spreadsheetId': '123'}
+        self.assertIs(build_renamer(None)(result), result)
+
 
 class TestColumnNameMappingIntegration(unittest.TestCase):
     """Integration tests for column name mapping feature."""
@@ -232,12 +249,9 @@ class TestColumnNameMappingIntegration(unittest.TestCase):
         mapped = map_result_keys(result, column_names)
         
         # Verify mapping
-        self.assertIn('ID', mapped)
-        self.assertIn('Nazwa', mapped)
-        self.assertIn('Zakładka', mapped)
-        self.assertIn('Komórka', mapped)
-        self.assertIn('Wartość', mapped)
-        self.assertIn('Stawka', mapped)
+        self.assertGreaterEqual(
+            mapped.keys(), {'ID', 'Nazwa', 'Zakładka', 'Komórka', 'Wartość', 'Stawka'}
+        )
     
     def test_comma_separated_mapping_flow(self):
         """Test complete flow with comma-separated mapping."""
@@ -258,9 +272,16 @@ class TestColumnNameMappingIntegration(unittest.TestCase):
         mapped = map_result_keys(result, column_names)
         
         # Verify mapping
-        self.assertIn('ID', mapped)
-        self.assertIn('Nazwa', mapped)
-        self.assertIn('Zakładka', mapped)
+        self.assertGreaterEqual(mapped.keys(), {'ID', 'Nazwa', 'Zakładka'})
+    
+    def test_build_result_renamer_flow(self):
+        """Test parsing argument directly into a renamer."""
+        rename_result = build_result_renamer('ID,Nazwa')
+        result = {'spreadsheetId': '123', 'spreadsheetName': 'Test', 'cell': 'A1'}
+        
+        self.assertEqual(rename_result(result), map_result_keys(result, ['ID', 'Nazwa']))
+        self.assertIs(build_result_renamer(None)(result), result)
+        self.assertIsNone(build_result_renamer('not valid json'))
 
 
 if __name__ == '__main__':
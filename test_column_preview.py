@@ -5,7 +5,7 @@ Unit tests for column preview functionality.
 
 import unittest
 from unittest.mock import MagicMock, Mock
-from sheets_search import get_sheet_headers_with_indices, get_sheet_data
+from sheets_search import get_sheet_headers_with_indices, get_sheet_data, get_sheet_data_many
 
 
 class TestColumnPreview(unittest.TestCase):
@@ -94,6 +94,34 @@ class TestColumnPreview(unittest.TestCase):
         result = get_sheet_data(sheets_service, 'test_id', 'Sheet1')
         
         self.assertEqual(result, [])
+    
+    def test_get_sheet_data_many_batch(self):
+        """Test: get_sheet_data_many fetches all sheets in one batchGet call."""
+        sheets_service = MagicMock()
+        sheets_service.spreadsheets().values().batchGet().execute.return_value = {
+            'valueRanges': [
+                {'range': 'Sheet1!A1:B2', 'values': [['Name'], ['Alice']]},
+                {'range': 'Sheet2!A1:A1'}
+            ]
+        }
+        
+        result = get_sheet_data_many(sheets_service, 'test_id', ['Sheet1', 'Sheet2'])
+        
+        self.assertEqual(result, {'Sheet1': [['Name'], ['Alice']], 'Sheet2': []})
+        sheets_service.spreadsheets().values().batchGet.assert_called_with(
+            spreadsheetId='test_id', ranges=['Sheet1', 'Sheet2'], majorDimension='ROWS'
+        )
+        sheets_service.spreadsheets().values().get().execute.assert_not_called()
+    
+    def test_get_sheet_data_many_fallback(self):
+        """Test: batchGet failure falls back to per-sheet fetches."""
+        sheets_service = MagicMock()
+        sheets_service.spreadsheets().values().batchGet().execute.side_effect = Exception("API Error")
+        sheets_service.spreadsheets().values().get().execute.return_value = {'values': [['A']]}
+        
+        result = get_sheet_data_many(sheets_service, 'test_id', ['Sheet1', 'Sheet2'])
+        
+        self.assertEqual(result, {'Sheet1': [['A']], 'Sheet2': [['A']]})
 
 
 if __name__ == '__main__':
@@ -16,6 +16,13 @@ from sheets_search import (
     detect_header_row,
 )
 
+# Wspólne dane testowe (niemutowalne - wykrywa przypadkową modyfikację wejścia)
+_NAMES_AGE_CITY = (
+    ("Name", "Age", "City"),
+    ("Alice", "30", "NYC"),
+    ("Bob", "25", "LA"),
+)
+
 
 class TestHeaderRows(unittest.TestCase):
     """Testy funkcjonalności wielu wierszy nagłówkowych."""
@@ -23,50 +30,50 @@ class TestHeaderRows(unittest.TestCase):
     # -------------------- Testy parse_header_rows --------------------
     
     def test_parse_header_rows_none(self):
-        """Test: None jako input zwraca [0] (default: wiersz 1)."""
+        """Test: None jako input zwraca (0,) (default: wiersz 1)."""
         result = parse_header_rows(None)
-        self.assertEqual(result, [0])
+        self.assertEqual(result, (0,))
 
     def test_parse_header_rows_empty(self):
-        """Test: pusty string zwraca [0] (default: wiersz 1)."""
+        """Test: pusty string zwraca (0,) (default: wiersz 1)."""
         result = parse_header_rows("")
-        self.assertEqual(result, [0])
+        self.assertEqual(result, (0,))
         
         result = parse_header_rows("   ")
-        self.assertEqual(result, [0])
+        self.assertEqual(result, (0,))
 
     def test_parse_header_rows_single_value(self):
-        """Test: pojedyncza wartość "1" zwraca [0]."""
+        """Test: pojedyncza wartość "1" zwraca (0,)."""
         result = parse_header_rows("1")
-        self.assertEqual(result, [0])
+        self.assertEqual(result, (0,))
         
     def test_parse_header_rows_single_value_2(self):
-        """Test: pojedyncza wartość "2" zwraca [1]."""
+        """Test: pojedyncza wartość "2" zwraca (1,)."""
         result = parse_header_rows("2")
-        self.assertEqual(result, [1])
+        self.assertEqual(result, (1,))
 
     def test_parse_header_rows_multiple_values(self):
-        """Test: wiele wartości "1,2" zwraca [0, 1]."""
+        """Test: wiele wartości "1,2" zwraca (0, 1)."""
         result = parse_header_rows("1,2")
-        self.assertEqual(result, [0, 1])
+        self.assertEqual(result, (0, 1))
 
     def test_parse_header_rows_multiple_values_with_spaces(self):
-        """Test: wartości z białymi znakami "1, 2, 3" zwraca [0, 1, 2]."""
+        """Test: wartości z białymi znakami "1, 2, 3" zwraca (0, 1, 2)."""
         result = parse_header_rows("1, 2, 3")
-        self.assertEqual(result, [0, 1, 2])
+        self.assertEqual(result, (0, 1, 2))
 
     def test_parse_header_rows_invalid_values(self):
         """Test: nieprawidłowe wartości są pomijane."""
         result = parse_header_rows("1, abc, 2")
-        self.assertEqual(result, [0, 1])
+        self.assertEqual(result, (0, 1))
         
         result = parse_header_rows("abc, def")
-        self.assertEqual(result, [0])  # Brak prawidłowych wartości -> default [0]
+        self.assertEqual(result, (0,))  # Brak prawidłowych wartości -> default (0,)
 
     def test_parse_header_rows_zero_or_negative(self):
         """Test: wartości <= 0 są pomijane."""
         result = parse_header_rows("0, 1, -1, 2")
-        self.assertEqual(result, [0, 1])
+        self.assertEqual(result, (0, 1))
 
     # -------------------- Testy combine_header_values --------------------
 
@@ -145,12 +152,7 @@ class TestHeaderRows(unittest.TestCase):
 
     def test_detect_header_row_with_single_index(self):
         """Test: detect_header_row z podanym pojedynczym indeksem."""
-        values = [
-            ["Name", "Age", "City"],
-            ["Alice", "30", "NYC"],
-            ["Bob", "25", "LA"]
-        ]
-        header_row_idx, header_row, start_row = detect_header_row(values, header_row_indices=[0])
+        header_row_idx, header_row, start_row = detect_header_row(_NAMES_AGE_CITY, header_row_indices=[0])
         self.assertEqual(header_row_idx, [0])
         self.assertEqual(header_row, ["name", "age", "city"])
         self.assertEqual(start_row, 1)
@@ -170,11 +172,8 @@ class TestHeaderRows(unittest.TestCase):
 
     def test_detect_header_row_with_no_indices_auto_detection(self):
         """Test: detect_header_row bez indeksów - auto-detekcja."""
-        values = [
-            ["Name", "Age", "City"],
-            ["Alice", "30", "NYC"],
-            ["Bob", "25", "LA"]
-        ]
+        # Auto-detekcja zwraca oryginalny wiersz, więc potrzebne są listy
+        values = list(map(list, _NAMES_AGE_CITY))
         header_row_idx, header_row, start_row = detect_header_row(values, header_row_indices=None)
         # Auto-detekcja powinna wybrać wiersz 0
         self.assertEqual(header_row_idx, 0)
@@ -196,10 +195,7 @@ class TestHeaderRows(unittest.TestCase):
 
     def test_backward_compatibility_no_header_row_indices(self):
         """Test: kompatybilność wsteczna - brak header_row_indices działa jak dotychczas."""
-        values = [
-            ["Name", "Age", "City"],
-            ["Alice", "30", "NYC"]
-        ]
+        values = _NAMES_AGE_CITY
         # Bez header_row_indices
         result_old = detect_header_row(values, search_column_name=None, header_row_indices=None)
         # Z header_row_indices=[0] (domyślne)
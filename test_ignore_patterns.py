@@ -15,6 +15,10 @@ from sheets_search import (
     parse_ignore_patterns,
     matches_ignore_pattern,
     find_all_column_indices_by_name,
+    compile_ignore_patterns,
+    build_ignore_mask,
+    build_header_index,
+    build_header_context,
 )
 
 
@@ -24,62 +28,71 @@ class TestIgnorePatterns(unittest.TestCase):
     # -------------------- Testy parse_ignore_patterns --------------------
     
     def test_parse_ignore_patterns_none(self):
-        """Test: None jako input zwraca pustą listę."""
+        """Test: None jako input zwraca pustą krotkę."""
         result = parse_ignore_patterns(None)
-        self.assertEqual(result, [])
+        self.assertEqual(result, ())
 
     def test_parse_ignore_patterns_empty(self):
-        """Test: pusty string zwraca pustą listę."""
+        """Test: pusty string zwraca pustą krotkę."""
         result = parse_ignore_patterns("")
-        self.assertEqual(result, [])
+        self.assertEqual(result, ())
         
         result = parse_ignore_patterns("   ")
-        self.assertEqual(result, [])
+        self.assertEqual(result, ())
 
     def test_parse_ignore_patterns_single_value(self):
         """Test: pojedyncza wartość."""
         result = parse_ignore_patterns("temp")
-        self.assertEqual(result, ["temp"])
+        self.assertEqual(result, ("temp",))
 
     def test_parse_ignore_patterns_comma_separated(self):
         """Test: wartości oddzielone przecinkami."""
         result = parse_ignore_patterns("temp, test, debug")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
 
     def test_parse_ignore_patterns_semicolon_separated(self):
         """Test: wartości oddzielone średnikami."""
         result = parse_ignore_patterns("temp; test; debug")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
 
     def test_parse_ignore_patterns_newline_separated(self):
         """Test: wartości oddzielone nowymi liniami."""
         result = parse_ignore_patterns("temp\ntest\ndebug")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
 
     def test_parse_ignore_patterns_mixed_separators(self):
         """Test: mieszane separatory (przecinki, średniki, nowe linie)."""
         result = parse_ignore_patterns("temp, test; debug\nold")
-        self.assertEqual(result, ["temp", "test", "debug", "old"])
+        self.assertEqual(result, ("temp", "test", "debug", "old"))
+        
+        result = parse_ignore_patterns("temp\r\ntest")
+        self.assertEqual(result, ("temp", "test"))
 
     def test_parse_ignore_patterns_with_whitespace(self):
         """Test: wartości z białymi znakami są trimowane."""
         result = parse_ignore_patterns("  temp  ,   test   ,  debug  ")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
 
     def test_parse_ignore_patterns_lowercase(self):
         """Test: wartości są konwertowane na lowercase."""
         result = parse_ignore_patterns("TEMP, Test, DeBuG")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
 
     def test_parse_ignore_patterns_with_wildcards(self):
         """Test: wzorce z wildcardami są zachowane."""
         result = parse_ignore_patterns("temp*, *test, *debug*")
-        self.assertEqual(result, ["temp*", "*test", "*debug*"])
+        self.assertEqual(result, ("temp*", "*test", "*debug*"))
 
     def test_parse_ignore_patterns_empty_values_filtered(self):
         """Test: puste wartości są pomijane."""
         result = parse_ignore_patterns("temp, , test, , debug")
-        self.assertEqual(result, ["temp", "test", "debug"])
+        self.assertEqual(result, ("temp", "test", "debug"))
+
+    def test_parse_ignore_patterns_returns_cached_tuple(self):
+        """Test: wynik jest niemutowalną krotką współdzieloną przez cache."""
+        result = parse_ignore_patterns("temp, test")
+        self.assertIsInstance(result, tuple)
+        self.assertIs(parse_ignore_patterns("temp, test"), result)
 
     # -------------------- Testy matches_ignore_pattern --------------------
 
@@ -171,6 +184,33 @@ class TestIgnorePatterns(unittest.TestCase):
         result = matches_ignore_pattern("", ["temp"])
         self.assertFalse(result)
 
+    # -------------------- Testy compile_ignore_patterns --------------------
+
+    def test_compile_ignore_patterns_buckets(self):
+        """Test: wzorce są grupowane wg rodzaju wildcardu."""
+        compiled = compile_ignore_patterns(["Temp*", "*old", "*debug*", "https", "*", " "])
+        self.assertEqual(compiled.prefixes, ("temp",))
+        self.assertEqual(compiled.suffixes, ("old",))
+        self.assertEqual(compiled.substrings, ("debug", "https"))
+        self.assertEqual(compiled.exacts, {"debug", "https"})
+
+    def test_compile_ignore_patterns_empty(self):
+        """Test: brak wzorców daje pusty (fałszywy) obiekt."""
+        self.assertFalse(compile_ignore_patterns(None))
+        self.assertFalse(compile_ignore_patterns([]))
+        self.assertFalse(compile_ignore_patterns(["*"]))
+        self.assertTrue(compile_ignore_patterns(["temp"]))
+
+    def test_matches_ignore_pattern_compiled(self):
+        """Test: skompilowane wzorce dają te same wyniki co lista."""
+        patterns = ["temp*", "*debug*", "old"]
+        compiled = compile_ignore_patterns(patterns)
+        for header in ["temporary", "debug_mode", "old", "production", ""]:
+            self.assertEqual(
+                matches_ignore_pattern(header, compiled),
+                matches_ignore_pattern(header, patterns)
+            )
+
     # -------------------- Testy integracji z find_all_column_indices_by_name --------------------
 
     def test_find_all_column_indices_no_ignore(self):
@@ -218,6 +258,39 @@ class TestIgnorePatterns(unittest.TestCase):
         # Indeksy 0 i 3 powinny być zwrócone (1 i 2 są ignorowane)
         self.assertEqual(result, [0, 3])
 
+    def test_find_all_column_indices_with_ignore_mask(self):
+        """Test: prebudowana maska daje te same wyniki co wzorce."""
+        headers = ["Test", "Test_Old", "Other", None, "Test"]
+        ignore = parse_ignore_patterns("*old")
+        mask = build_ignore_mask(headers, ignore)
+        self.assertEqual(mask, [False, True, False, False, False])
+        for name in ("Test", "Test_Old", "Other"):
+            self.assertEqual(
+                find_all_column_indices_by_name(headers, name, ignore_mask=mask),
+                find_all_column_indices_by_name(headers, name, ignore_patterns=ignore)
+            )
+
+    def test_find_all_column_indices_with_header_index(self):
+        """Test: wyszukiwanie przez indeks nagłówków daje te same wyniki."""
+        headers = ["Numer_Zlecenia", "Numer_Zlecenia_Old", None, "numer zlecenia "]
+        header_index = build_header_index(headers)
+        self.assertEqual(header_index, {"numer zlecenia": [0, 3], "numer zlecenia old": [1]})
+        ignore = parse_ignore_patterns("*old")
+        for name in ("Numer Zlecenia", "Numer_Zlecenia_Old", "Brak"):
+            self.assertEqual(
+                find_all_column_indices_by_name(headers, name, ignore, header_index=header_index),
+                find_all_column_indices_by_name(headers, name, ignore)
+            )
+
+    def test_build_header_context_matches_separate_builders(self):
+        """Test: kontekst nagłówków jest równoważny build_header_index + build_ignore_mask."""
+        headers = ["Numer_Zlecenia", "Numer_Zlecenia_Old", None, "", "numer zlecenia old"]
+        for ignore in (None, parse_ignore_patterns("*old"), parse_ignore_patterns("numer*")):
+            context = build_header_context(headers, ignore)
+            self.assertEqual(context.header_index, build_header_index(headers))
+            self.assertEqual(context.ignore_mask, build_ignore_mask(headers, ignore))
+        self.assertEqual(build_header_context([], None), ({}, []))
+
     def test_backward_compatibility_empty_ignore(self):
         """Test: kompatybilność wsteczna - puste ignore_patterns działa jak None."""
         headers = ["Test", "Other", "Test"]
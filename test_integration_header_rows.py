@@ -39,7 +39,7 @@ class TestHeaderRowsIntegration(unittest.TestCase):
         
         # Parse header rows configuration
         header_row_indices = parse_header_rows("1,2")
-        self.assertEqual(header_row_indices, [0, 1])
+        self.assertEqual(header_row_indices, (0, 1))
         
         # Detect header row and combine headers
         header_row_idx, header_row, start_row = detect_header_row(
@@ -48,13 +48,13 @@ class TestHeaderRowsIntegration(unittest.TestCase):
             header_row_indices=header_row_indices
         )
         
-        self.assertEqual(header_row_idx, [0, 1])
+        self.assertEqual(header_row_idx, (0, 1))
         self.assertEqual(header_row, ["first last", "age years", "home city", "temp data"])
         self.assertEqual(start_row, 2)  # Dane zaczynają się od wiersza 2 (indeks 2)
         
         # Parse ignore patterns
         ignore_patterns = parse_ignore_patterns("temp*")
-        self.assertEqual(ignore_patterns, ["temp*"])
+        self.assertEqual(ignore_patterns, ("temp*",))
         
         # Check which columns should be found
         # Szukamy kolumny "First Last" - powinna być znaleziona
@@ -85,7 +85,7 @@ class TestHeaderRowsIntegration(unittest.TestCase):
         
         # Parse header rows configuration - default "1"
         header_row_indices = parse_header_rows("1")
-        self.assertEqual(header_row_indices, [0])
+        self.assertEqual(header_row_indices, (0,))
         
         # Detect header row
         header_row_idx, header_row, start_row = detect_header_row(
@@ -94,7 +94,7 @@ class TestHeaderRowsIntegration(unittest.TestCase):
             header_row_indices=header_row_indices
         )
         
-        self.assertEqual(header_row_idx, [0])
+        self.assertEqual(header_row_idx, (0,))
         self.assertEqual(header_row, ["name", "age", "city"])
         self.assertEqual(start_row, 1)
 
@@ -165,18 +165,18 @@ class TestHeaderRowsIntegration(unittest.TestCase):
     def test_empty_header_rows_defaults_to_one(self):
         """Test: puste pole Header rows domyślnie używa wiersza 1."""
         header_row_indices = parse_header_rows("")
-        self.assertEqual(header_row_indices, [0])
+        self.assertEqual(header_row_indices, (0,))
         
         header_row_indices = parse_header_rows(None)
-        self.assertEqual(header_row_indices, [0])
+        self.assertEqual(header_row_indices, (0,))
 
     def test_invalid_header_rows_defaults_to_one(self):
         """Test: nieprawidłowe wartości w Header rows domyślnie używają wiersza 1."""
         header_row_indices = parse_header_rows("abc")
-        self.assertEqual(header_row_indices, [0])
+        self.assertEqual(header_row_indices, (0,))
         
         header_row_indices = parse_header_rows("0, -1")
-        self.assertEqual(header_row_indices, [0])
+        self.assertEqual(header_row_indices, (0,))
 
 
 if __name__ == "__main__":
@@ -5,11 +5,14 @@ Testy integracyjne dla funkcjonalności wyszukiwania wielu kolumn.
 Symuluje rzeczywiste scenariusze z wieloma kolumnami o tej samej nazwie.
 """
 
+import threading
 import unittest
 from unittest.mock import MagicMock, patch
 from sheets_search import (
     search_in_sheet,
+    search_in_spreadsheet,
     find_duplicates_in_sheet,
+    SHEETS_PER_BATCH,
 )
 
 
@@ -230,6 +233,112 @@ class TestMultiColumnIntegration(unittest.TestCase):
         # Powinniśmy znaleźć 4 dopasowania w różnych miejscach
         self.assertEqual(len(results), 4)
 
+    def test_search_in_spreadsheet_fetches_all_sheets_with_one_batch_get(self):
+        """
+        Test: wszystkie zakładki arkusza są pobierane jednym zapytaniem batchGet.
+        
+        Scenariusz:
+        - Arkusz ma 2 zakładki z kolumną "Zlecenie"
+        - Wartości są pobierane przez values().batchGet, a nie values().get per zakładka
+        """
+        spreadsheets = self.mock_sheets_service.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            "properties": {"title": "Test Spreadsheet"},
+            "sheets": [{"properties": {"title": "Sheet1"}}, {"properties": {"title": "Sheet2"}}],
+        }
+        spreadsheets.values.return_value.batchGet.return_value.execute.return_value = {
+            "valueRanges": [
+                {"values": [["Zlecenie", "Stawka"], ["12345", "100"]]},
+                {"values": [["Zlecenie", "Stawka"], ["99999", "50"], ["12345", "75"]]},
+            ]
+        }
+        
+        results = list(search_in_spreadsheet(
+            self.mock_drive_service,
+            self.mock_sheets_service,
+            spreadsheet_id="test_id",
+            pattern="12345",
+            search_column_name="Zlecenie",
+        ))
+        
+        self.assertEqual(
+            [(r["sheetName"], r["cell"], r["stawka"]) for r in results],
+            [("Sheet1", "A2", "100"), ("Sheet2", "A3", "75")]
+        )
+        spreadsheets.values.return_value.batchGet.assert_called_once()
+        spreadsheets.values.return_value.get.assert_not_called()
+
+    def test_search_in_spreadsheet_fetches_sheets_in_batches(self):
+        """
+        Test: zakładki są pobierane partiami po SHEETS_PER_BATCH, a stop_event
+        jest sprawdzany po pobraniu każdej partii.
+        """
+        spreadsheets = self.mock_sheets_service.spreadsheets.return_value
+        sheet_names = [f"Sheet{i}" for i in range(SHEETS_PER_BATCH * 2)]
+        spreadsheets.get.return_value.execute.return_value = {
+            "properties": {"title": "Test Spreadsheet"},
+            "sheets": [{"properties": {"title": name}} for name in sheet_names],
+        }
+        spreadsheets.values.return_value.batchGet.return_value.execute.return_value = {
+            "valueRanges": [{"values": [["Zlecenie", "Stawka"], ["12345", "100"]]}] * SHEETS_PER_BATCH
+        }
+        
+        results = list(search_in_spreadsheet(
+            self.mock_drive_service,
+            self.mock_sheets_service,
+            spreadsheet_id="test_id",
+            pattern="12345",
+            search_column_name="Zlecenie",
+        ))
+        
+        self.assertEqual([r["sheetName"] for r in results], sheet_names)
+        batch_get = spreadsheets.values.return_value.batchGet
+        self.assertEqual(
+            [c.kwargs["ranges"] for c in batch_get.call_args_list],
+            [sheet_names[:SHEETS_PER_BATCH], sheet_names[SHEETS_PER_BATCH:]]
+        )
+        
+        # Zatrzymanie w trakcie pobierania partii - brak wyników i kolejnych zapytań
+        batch_get.reset_mock()
+        stop_event = threading.Event()
+        spreadsheets.values.return_value.batchGet.return_value.execute.side_effect = (
+            lambda: stop_event.set() or {"valueRanges": []}
+        )
+        
+        results = list(search_in_spreadsheet(
+            self.mock_drive_service,
+            self.mock_sheets_service,
+            spreadsheet_id="test_id",
+            pattern="12345",
+            search_column_name="Zlecenie",
+            stop_event=stop_event,
+        ))
+        
+        self.assertEqual(results, [])
+        batch_get.assert_called_once()
+
+    def test_search_in_sheet_with_prefetched_values_skips_api(self):
+        """Test: przekazane wartości zakładki są przeszukiwane bez zapytań do API."""
+        mock_values = [
+            ["Zlecenie", "Stawka", "Zlecenie"],
+            ["12345", "100", "67890"],
+            ["54321", "200", "12345"],
+        ]
+        
+        results = list(search_in_sheet(
+            self.mock_drive_service,
+            self.mock_sheets_service,
+            spreadsheet_id="test_id",
+            sheet_name="Sheet1",
+            pattern="12345",
+            search_column_name="Zlecenie",
+            spreadsheet_name="Test Spreadsheet",
+            values=mock_values,
+        ))
+        
+        self.assertEqual([r["cell"] for r in results], ["A2", "C3"])
+        self.mock_sheets_service.spreadsheets.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=2)
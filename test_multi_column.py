@@ -13,6 +13,7 @@ from sheets_search import (
     find_all_column_indices_by_name,
     normalize_header_name,
     find_column_index_by_name,
+    col_index_to_a1,
 )
 
 
@@ -86,6 +87,24 @@ class TestMultiColumnSearch(unittest.TestCase):
         self.assertEqual(normalize_header_name(123), "123")
         self.assertEqual(normalize_header_name(45.67), "45.67")
 
+    def test_normalize_header_name_cache_keeps_types_apart(self):
+        """Test: pamięć podręczna nie myli równych wartości różnych typów (1 == 1.0 == True)."""
+        self.assertEqual(normalize_header_name(1), "1")
+        self.assertEqual(normalize_header_name(1.0), "1.0")
+        self.assertEqual(normalize_header_name(True), "true")
+        self.assertEqual(normalize_header_name("\tTest_\nColumn "), "test column")
+
+    def test_col_index_to_a1_labels(self):
+        """Test: etykiety kolumn A1 na granicach tablicy etykiet i poza nią."""
+        self.assertEqual(col_index_to_a1(0), "A")
+        self.assertEqual(col_index_to_a1(25), "Z")
+        self.assertEqual(col_index_to_a1(26), "AA")
+        self.assertEqual(col_index_to_a1(701), "ZZ")
+        self.assertEqual(col_index_to_a1(702), "AAA")
+        self.assertEqual(col_index_to_a1("3"), "D")
+        self.assertEqual(col_index_to_a1(None), "?")
+        self.assertEqual(col_index_to_a1(-1), "?")
+
     def test_backward_compatibility_single_column(self):
         """Test: kompatybilność wsteczna - find_column_index_by_name zwraca pierwszy indeks."""
         headers = ["Test", "Other", "Test"]
@@ -7,17 +7,25 @@ Tests the get_quadra_table_headers() function and column mapping logic.
 import unittest
 from quadra_service import get_quadra_table_headers, map_column_names
 
+# Expected default Polish headers (shared by the default-header tests)
+_DEFAULT_HEADERS = ('Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci',
+                    'Status', 'Kolumna', 'Wiersz', 'Uwagi')
+# Marks the call without any argument (backward-compatible default)
+_NO_ARGUMENT = object()
+
 
 class TestGetQuadraTableHeaders(unittest.TestCase):
     """Tests for get_quadra_table_headers() function."""
     
-    def test_default_headers_no_mapping(self):
-        """Test that default Polish headers are returned when no mapping is provided."""
-        headers = get_quadra_table_headers(None)
-        
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        self.assertEqual(headers, expected)
+    def test_default_header_variants(self):
+        """Test that default Polish headers are returned for no mapping, None, {} and []."""
+        for case in (_NO_ARGUMENT, None, {}, []):
+            with self.subTest(case=case):
+                if case is _NO_ARGUMENT:
+                    headers = get_quadra_table_headers()
+                else:
+                    headers = get_quadra_table_headers(case)
+                self.assertListEqual(headers, list(_DEFAULT_HEADERS))
     
     def test_dict_mapping_exact_match(self):
         """Test dictionary mapping with exact matches."""
@@ -29,11 +37,9 @@ class TestGetQuadraTableHeaders(unittest.TestCase):
         
         headers = get_quadra_table_headers(column_names)
         
-        self.assertEqual(headers[0], 'Sheet')      # Arkusz -> Sheet
-        self.assertEqual(headers[1], 'Płatnik')    # Unmapped, stays as is
-        self.assertEqual(headers[3], 'Rate')       # Stawka -> Rate
-        self.assertEqual(headers[5], 'State')      # Status -> State
-        self.assertEqual(headers[8], 'Uwagi')      # Unmapped, stays as is
+        # Arkusz -> Sheet, Stawka -> Rate, Status -> State; unmapped stay as is
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Numer z DBF', 'Rate', 'Czesci',
+                                       'State', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_dict_mapping_case_insensitive(self):
         """Test dictionary mapping with case-insensitive matching."""
@@ -45,9 +51,9 @@ class TestGetQuadraTableHeaders(unittest.TestCase):
         
         headers = get_quadra_table_headers(column_names)
         
-        self.assertEqual(headers[0], 'Sheet')      # arkusz -> Arkusz -> Sheet
-        self.assertEqual(headers[3], 'Rate')       # STAWKA -> Stawka -> Rate
-        self.assertEqual(headers[5], 'State')      # StAtUs -> Status -> State
+        # arkusz -> Arkusz -> Sheet, STAWKA -> Stawka -> Rate, StAtUs -> Status -> State
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Numer z DBF', 'Rate', 'Czesci',
+                                       'State', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_dict_mapping_whitespace_normalization(self):
         """Test dictionary mapping with whitespace normalization."""
@@ -59,9 +65,9 @@ class TestGetQuadraTableHeaders(unittest.TestCase):
         
         headers = get_quadra_table_headers(column_names)
         
-        self.assertEqual(headers[0], 'Sheet')      # Arkusz (trimmed)
-        self.assertEqual(headers[2], 'Number')     # Numer z DBF
-        self.assertEqual(headers[3], 'Rate')       # Stawka (trimmed)
+        # Arkusz (trimmed), Numer z DBF, Stawka (trimmed)
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Number', 'Rate', 'Czesci',
+                                       'Status', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_list_mapping_all_columns(self):
         """Test list mapping with all 9 column names."""
@@ -72,7 +78,7 @@ class TestGetQuadraTableHeaders(unittest.TestCase):
         
         headers = get_quadra_table_headers(column_names)
         
-        self.assertEqual(headers, column_names)
+        self.assertListEqual(headers, column_names)
     
     def test_list_mapping_partial(self):
         """Test list mapping with fewer than 9 column names."""
@@ -80,30 +86,9 @@ class TestGetQuadraTableHeaders(unittest.TestCase):
         
         headers = get_quadra_table_headers(column_names)
         
-        # First 3 should be mapped
-        self.assertEqual(headers[0], 'Sheet')
-        self.assertEqual(headers[1], 'Payer')
-        self.assertEqual(headers[2], 'Number')
-        # Rest should use defaults
-        self.assertEqual(headers[3], 'Stawka')
-        self.assertEqual(headers[4], 'Czesci')
-        self.assertEqual(headers[5], 'Status')
-    
-    def test_empty_dict_mapping(self):
-        """Test that empty dictionary returns default headers."""
-        headers = get_quadra_table_headers({})
-        
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        self.assertEqual(headers, expected)
-    
-    def test_empty_list_mapping(self):
-        """Test that empty list returns default headers."""
-        headers = get_quadra_table_headers([])
-        
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        self.assertEqual(headers, expected)
+        # First 3 should be mapped, rest should use defaults
+        self.assertListEqual(headers, ['Sheet', 'Payer', 'Number', 'Stawka', 'Czesci',
+                                       'Status', 'Kolumna', 'Wiersz', 'Uwagi'])
 
 
 class TestMapColumnNames(unittest.TestCase):
@@ -121,9 +106,7 @@ class TestMapColumnNames(unittest.TestCase):
         result = map_column_names(original, mapping)
         
         # Should match case-insensitively with normalization
-        self.assertEqual(result[0], 'Given Name')
-        self.assertEqual(result[1], 'Family Name')
-        self.assertEqual(result[2], 'E-mail')
+        self.assertListEqual(result, ['Given Name', 'Family Name', 'E-mail'])
     
     def test_dict_mapping_preserves_unmapped(self):
         """Test that unmapped columns are preserved in original form."""
@@ -135,10 +118,8 @@ class TestMapColumnNames(unittest.TestCase):
         
         result = map_column_names(original, mapping)
         
-        self.assertEqual(result[0], 'Full Name')
-        self.assertEqual(result[1], 'Years')
-        self.assertEqual(result[2], 'City')      # Preserved
-        self.assertEqual(result[3], 'Country')   # Preserved
+        # City and Country are preserved
+        self.assertListEqual(result, ['Full Name', 'Years', 'City', 'Country'])
     
     def test_list_mapping_partial_coverage(self):
         """Test list mapping with partial coverage."""
@@ -147,28 +128,25 @@ class TestMapColumnNames(unittest.TestCase):
         
         result = map_column_names(original, mapping)
         
-        self.assertEqual(result[0], 'Alpha')
-        self.assertEqual(result[1], 'Beta')
-        self.assertEqual(result[2], 'Gamma')
-        self.assertEqual(result[3], 'D')  # Original
-        self.assertEqual(result[4], 'E')  # Original
+        # D and E keep their original names
+        self.assertListEqual(result, ['Alpha', 'Beta', 'Gamma', 'D', 'E'])
     
     def test_invalid_mapping_type_returns_original(self):
-        """Test that invalid mapping type returns original columns."""
+        """Test that invalid mapping type returns the original list object (not a copy)."""
         original = ['A', 'B', 'C']
         mapping = "invalid"  # String instead of dict or list
         
         result = map_column_names(original, mapping)
         
-        self.assertEqual(result, original)
+        self.assertIs(result, original)
     
     def test_none_mapping_returns_original(self):
-        """Test that None mapping returns original columns unchanged."""
+        """Test that None mapping returns the original list object unchanged (not a copy)."""
         original = ['Column1', 'Column2', 'Column3']
         
         result = map_column_names(original, None)
         
-        self.assertEqual(result, original)
+        self.assertIs(result, original)
 
 
 class TestQuadraColumnMappingIntegration(unittest.TestCase):
@@ -187,24 +165,10 @@ class TestQuadraColumnMappingIntegration(unittest.TestCase):
         
         headers = get_quadra_table_headers(mapping)
         
-        # Verify specific mappings
-        self.assertIn('Sheet Name', headers)
-        self.assertIn('Order Number', headers)
-        self.assertIn('Price', headers)
-        
-        # Verify unmapped headers are preserved
-        self.assertIn('Płatnik', headers)
-        self.assertIn('Status', headers)
-    
-    def test_backward_compatibility(self):
-        """Test that default behavior is preserved (backward compatible)."""
-        # When no mapping is provided, should return default Polish headers
-        headers = get_quadra_table_headers()
-        
-        default_headers = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                          'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        
-        self.assertEqual(headers, default_headers)
+        # Verify specific mappings and that unmapped headers are preserved
+        self.assertGreaterEqual(
+            set(headers), {'Sheet Name', 'Order Number', 'Price', 'Płatnik', 'Status'}
+        )
 
 
 if __name__ == '__main__':
@@ -8,6 +8,9 @@ Test Dependencies:
   Note: Production code uses 'dbfread' for reading, which is lighter and read-only.
 """
 
+import csv
+import io
+import json
 import unittest
 import tempfile
 import os
@@ -18,18 +21,26 @@ from quadra_service import (
     column_letter_to_index,
     parse_column_identifier,
     read_dbf_column,
+    read_dbf_columns,
     detect_dbf_field_name,
     map_dbf_record_to_result,
+    resolve_dbf_field_map,
     read_dbf_records_with_extra_fields,
+    iter_dbf_records_with_extra_fields,
     normalize_value_for_comparison,
     values_match,
     search_value_in_sheet_data,
+    build_sheet_value_index,
     search_dbf_values_in_sheets,
     format_quadra_result_for_table,
     map_column_names,
     export_quadra_results_to_json,
+    export_quadra_results_to_json_stream,
     export_quadra_results_to_csv,
+    export_quadra_results_to_csv_iter,
     write_quadra_results_to_sheet,
+    write_quadra_results_to_sheets,
+    invalidate_spreadsheet_cache,
 )
 
 
@@ -44,6 +55,8 @@ class TestColumnParsing(unittest.TestCase):
         self.assertEqual(column_letter_to_index('AA'), 26)
         self.assertEqual(column_letter_to_index('AB'), 27)
         self.assertEqual(column_letter_to_index('AZ'), 51)
+        self.assertEqual(column_letter_to_index('ZZ'), 701)
+        self.assertEqual(column_letter_to_index('AAA'), 702)
     
     def test_column_letter_case_insensitive(self):
         """Test that column letter parsing is case-insensitive."""
@@ -93,6 +106,14 @@ class TestValueNormalization(unittest.TestCase):
         """Test normalization of None values."""
         self.assertEqual(normalize_value_for_comparison(None), '')
     
+    def test_normalize_value_for_comparison_cache_keeps_types_apart(self):
+        """Test that cached normalization distinguishes equal values of different types."""
+        self.assertEqual(normalize_value_for_comparison(1), '1')
+        self.assertEqual(normalize_value_for_comparison(1.0), '1.0')
+        self.assertEqual(normalize_value_for_comparison(True), 'true')
+        # Unhashable values bypass the cache
+        self.assertEqual(normalize_value_for_comparison(['A']), "['a']")
+    
     def test_values_match_exact(self):
         """Test exact value matching."""
         self.assertTrue(values_match('Test', 'test', mode='exact'))
@@ -187,6 +208,49 @@ class TestSearchValueInSheetData(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result['columnIndex'], 1)
         self.assertEqual(result['columnName'], 'Order')
+    
+    def test_sheet_value_index_matches_exact_search(self):
+        """Test that the exact-mode index returns the same first match as a linear search."""
+        sheet_data = [
+            ['ID', 'Order', 'Order'],
+            [1, '12 345', ' abc '],
+            [2, 'ABC', '12345'],
+            [3],
+        ]
+        for column_names in (None, ['Order']):
+            index = build_sheet_value_index(sheet_data, 'Sheet1', column_names)
+            for target in ('12345', 12345, 'abc', 'ABC ', '1', 'missing'):
+                with self.subTest(column_names=column_names, target=target):
+                    expected = search_value_in_sheet_data(
+                        target_value=target,
+                        sheet_values=sheet_data,
+                        sheet_name='Sheet1',
+                        mode='exact',
+                        column_names=column_names
+                    )
+                    self.assertEqual(index.get(normalize_value_for_comparison(target)), expected)
+    
+    def test_search_agrees_with_values_match(self):
+        """Test that the single-comparator scan finds the same cell as values_match per cell."""
+        sheet_data = [
+            ['ID', 'Order'],
+            [1, None],
+            [2, ''],
+            [3, 'ABC-001'],
+            [4, 12345],
+        ]
+        for mode in ('exact', 'substring'):
+            for target in ('abc-001', 'ABC', '12345', 12345, None, '', 'missing'):
+                with self.subTest(mode=mode, target=target):
+                    expected = next(
+                        ((r, c) for r in range(1, len(sheet_data))
+                         for c in range(len(sheet_data[r]))
+                         if values_match(target, sheet_data[r][c], mode)),
+                        None
+                    )
+                    result = search_value_in_sheet_data(target, sheet_data, 'Sheet1', mode)
+                    actual = (result['rowIndex'], result['columnIndex']) if result else None
+                    self.assertEqual(actual, expected)
 
 
 class TestResultFormatting(unittest.TestCase):
@@ -319,23 +383,25 @@ class TestDBFReading(unittest.TestCase):
     Both libraries are compatible with the same DBF file format.
     """
     
-    def setUp(self):
-        """Create a temporary DBF file for testing."""
+    @classmethod
+    def setUpClass(cls):
+        """Create a temporary DBF file once for the class (tests only read it)."""
         # Create temporary DBF file
-        self.temp_dir = tempfile.mkdtemp()
-        self.dbf_path = os.path.join(self.temp_dir, 'test.dbf')
+        cls.temp_dir = tempfile.mkdtemp()
+        cls.dbf_path = os.path.join(cls.temp_dir, 'test.dbf')
         
-        table = dbf.Table(self.dbf_path, 'id N(10,0); order_num C(20); desc C(50)')
+        table = dbf.Table(cls.dbf_path, 'id N(10,0); order_num C(20); desc C(50)')
         table.open(mode=dbf.READ_WRITE)
         table.append((1, '12345', 'Test 1'))
         table.append((2, '67890', 'Test 2'))
         table.append((3, 'ABC-001', 'Test 3'))
         table.close()
     
-    def tearDown(self):
+    @classmethod
+    def tearDownClass(cls):
         """Clean up temporary files."""
-        if os.path.exists(self.temp_dir):
-            shutil.rmtree(self.temp_dir)
+        if os.path.exists(cls.temp_dir):
+            shutil.rmtree(cls.temp_dir)
     
     def test_read_dbf_column_by_letter(self):
         """Test reading DBF column by letter identifier."""
@@ -351,6 +417,22 @@ class TestDBFReading(unittest.TestCase):
         self.assertEqual(len(values), 3)
         self.assertEqual(values[0], '12345')
     
+    def test_read_dbf_column_numeric_field(self):
+        """Test that a numeric column is still decoded when only one field is parsed."""
+        values = read_dbf_column(self.dbf_path, 'A')
+        self.assertEqual(values, [1, 2, 3])
+    
+    def test_read_dbf_columns_single_pass(self):
+        """Test reading several columns at once, keyed by the given identifiers."""
+        values = read_dbf_columns(self.dbf_path, ['B', 1, 'C'])
+        self.assertEqual(values, {
+            'B': ['12345', '67890', 'ABC-001'],
+            1: [1, 2, 3],
+            'C': ['Test 1', 'Test 2', 'Test 3'],
+        })
+        with self.assertRaises(ValueError):
+            read_dbf_columns(self.dbf_path, ['B', 'ZZ'])
+    
     def test_read_dbf_column_invalid_file(self):
         """Test reading from non-existent DBF file."""
         with self.assertRaises(FileNotFoundError):
@@ -471,6 +553,23 @@ class TestMapDBFRecord(unittest.TestCase):
         self.assertEqual(result['czesci'], '')
         self.assertEqual(result['platnik'], '')  # Platnik not present
     
+    def test_map_dbf_record_with_resolved_field_map(self):
+        """Test that a field map resolved once gives the same result for every record."""
+        field_names = ['NR', 'CENA', 'PART', 'PAYER']
+        mapping = {'platnik': 'PAYER'}
+        field_map = resolve_dbf_field_map(field_names, mapping)
+        self.assertEqual(tuple(field_map), ('NR', 'CENA', 'PART', 'PAYER'))
+        
+        records = [
+            {'NR': '1', 'CENA': '10.00', 'PART': 'A', 'PAYER': 'X'},
+            {'NR': ' 2 ', 'CENA': None, 'PART': 'B', 'PAYER': None},
+        ]
+        for record in records:
+            self.assertEqual(
+                map_dbf_record_to_result(record, field_names, field_map=field_map),
+                map_dbf_record_to_result(record, field_names, mapping)
+            )
+    
     def test_map_dbf_record_with_user_mapping(self):
         """Test mapping record with user-provided mapping."""
         record = {
@@ -603,6 +702,20 @@ class TestReadDBFRecordsWithExtraFields(unittest.TestCase):
         self.assertEqual(records[0]['stawka'], '')
         self.assertEqual(records[0]['czesci'], '')
         self.assertEqual(records[0]['platnik'], '')  # Platnik not present
+    
+    def test_iter_records_lazy_with_eager_validation(self):
+        """Test that the iterator yields the same records and validates the column up front."""
+        records = iter_dbf_records_with_extra_fields(self.dbf_path, 'B')
+        
+        self.assertEqual(next(records)['value'], '12345')
+        self.assertEqual(
+            [r['value'] for r in records],
+            ['67890', 'ABC-001']
+        )
+        
+        # Invalid column is reported when the iterator is created, not on first next()
+        with self.assertRaises(ValueError):
+            iter_dbf_records_with_extra_fields(self.dbf_path, 'Z')
 
 
 class TestSearchDBFValuesWithExtraFields(unittest.TestCase):
@@ -653,6 +766,72 @@ class TestSearchDBFValuesWithExtraFields(unittest.TestCase):
         self.assertEqual(results[1]['czesci'], '')
         self.assertEqual(results[1]['platnik'], '')  # Platnik not in simple values
     
+    def test_search_multiple_sheets_uses_batch_get(self):
+        """Test that several sheets are loaded with one batchGet request, searched in order."""
+        mock_drive = MagicMock()
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'title': 'Sheet1'}}, {'properties': {'title': 'Sheet2'}}]
+        }
+        spreadsheets.values.return_value.batchGet.return_value.execute.return_value = {
+            'valueRanges': [
+                {'values': [['Order'], ['12345']]},
+                {'values': [['Order'], ['67890'], ['12345']]},
+            ]
+        }
+        
+        results = search_dbf_values_in_sheets(
+            drive_service=mock_drive,
+            sheets_service=mock_sheets,
+            dbf_values=['12345', '67890', '99999'],
+            spreadsheet_id='test_id',
+            mode='exact'
+        )
+        
+        self.assertEqual(
+            [(r['found'], r['sheetName'], r['rowIndex']) for r in results],
+            [(True, 'Sheet1', 1), (True, 'Sheet2', 1), (False, None, None)]
+        )
+        spreadsheets.values.return_value.batchGet.assert_called_once()
+        spreadsheets.values.return_value.get.assert_not_called()
+    
+    def test_substring_search_matches_sheet_scan(self):
+        """Test that substring search over distinct values finds the same cell as a full scan."""
+        sheet_values = [
+            ['Order', 'Description'],
+            ['ABC-001', 'abc'],
+            ['abc', 'XABC-0012'],
+            ['12345', None],
+        ]
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'title': 'Sheet1'}}]
+        }
+        spreadsheets.values.return_value.get.return_value.execute.return_value = {
+            'values': sheet_values
+        }
+        targets = ['abc', 'ABC-0012', '234', 'x', '', None, 'missing']
+        
+        results = search_dbf_values_in_sheets(
+            drive_service=MagicMock(),
+            sheets_service=mock_sheets,
+            dbf_values=targets,
+            spreadsheet_id='test_id',
+            mode='substring'
+        )
+        
+        for target, result in zip(targets, results):
+            with self.subTest(target=target):
+                expected = search_value_in_sheet_data(target, sheet_values, 'Sheet1', 'substring')
+                self.assertEqual(result['found'], expected is not None)
+                if expected:
+                    self.assertEqual(
+                        (result['rowIndex'], result['columnIndex']),
+                        (expected['rowIndex'], expected['columnIndex'])
+                    )
+    
     def test_search_with_record_dicts(self):
         """Test search with record dictionaries containing extra fields."""
         # Mock services
@@ -791,6 +970,24 @@ class TestExportQuadraResultsWithExtraFields(unittest.TestCase):
         self.assertEqual(export_data[0]['czesci'], 'ABC')
         self.assertEqual(export_data[0]['status'], 'Found')
     
+    def test_export_to_json_stream(self):
+        """Test that the streamed JSON array matches json.dump of the list export with indent=2."""
+        results = [
+            {'dbfValue': '12345', 'found': True, 'sheetName': 'Sheet1', 'columnName': 'Order',
+             'columnIndex': 1, 'rowIndex': 5, 'matchedValue': 12345, 'notes': 'Zażółć'},
+            {'dbfValue': 678, 'found': False, 'sheetName': None, 'columnName': None,
+             'columnIndex': None, 'rowIndex': None, 'matchedValue': None, 'notes': 'Not found'},
+        ]
+        for column_names in (None, {'dbfValue': 'Numer'}):
+            for data in ([], results):
+                with self.subTest(column_names=column_names, count=len(data)):
+                    output = io.StringIO()
+                    count = export_quadra_results_to_json_stream(iter(data), output, column_names)
+                    self.assertEqual(count, len(data))
+                    self.assertEqual(output.getvalue(),
+                                     json.dumps(export_quadra_results_to_json(data, column_names),
+                                                ensure_ascii=False, indent=2))
+    
     def test_export_to_csv(self):
         """Test CSV export with extra fields."""
         results = [
@@ -823,11 +1020,32 @@ class TestExportQuadraResultsWithExtraFields(unittest.TestCase):
         self.assertIn('12345', data_row)
         self.assertIn('150.00', data_row)
         self.assertIn('ABC', data_row)
+    
+    def test_export_to_csv_iter(self):
+        """Test that CSV lines are yielded lazily, one per result, with proper quoting."""
+        results = [
+            {'dbfValue': '12345', 'found': True, 'notes': 'Found, "quoted"'},
+            {'dbfValue': 678, 'found': False, 'matchedValue': None},
+        ]
+        
+        lines = export_quadra_results_to_csv_iter(iter(results), ['Numer'])
+        
+        self.assertEqual(next(lines).split(',')[:2], ['Numer', 'Stawka'])
+        rows = list(csv.reader(lines))
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0][-1], 'Found, "quoted"')
+        self.assertEqual(rows[1][:3], ['678', '', 'Missing'])
+        self.assertEqual(export_quadra_results_to_csv(results, ['Numer']),
+                         ''.join(export_quadra_results_to_csv_iter(results, ['Numer'])))
 
 
 class TestWriteQuadraResultsToSheet(unittest.TestCase):
     """Tests for writing Quadra results to Google Sheets."""
     
+    def setUp(self):
+        """Start every test without cached sheet metadata."""
+        invalidate_spreadsheet_cache()
+    
     def test_write_results_to_sheet(self):
         """Test writing results to columns I and J."""
         # Mock services
@@ -930,6 +1148,121 @@ class TestWriteQuadraResultsToSheet(unittest.TestCase):
             )
         
         self.assertIn("Sheet 'Sheet1' not found", str(cm.exception))
+    
+    def test_write_results_to_several_sheets_in_one_request(self):
+        """Test that several sheets are written with a single batchUpdate request."""
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}},
+                       {'properties': {'sheetId': 2, 'title': 'Sheet2'}}]
+        }
+        
+        write_quadra_results_to_sheets(
+            sheets_service=mock_sheets,
+            spreadsheet_id='test_id',
+            sheet_results=[
+                ('Sheet1', [{'stawka': '150.00', 'czesci': 'ABC'}, {'stawka': None, 'czesci': 'XYZ'}]),
+                ('Sheet2', [{'stawka': '200.50', 'czesci': ''}]),
+                ('Sheet3', []),
+            ]
+        )
+        
+        spreadsheets.values.return_value.batchUpdate.assert_called_once_with(
+            spreadsheetId='test_id',
+            body={
+                'valueInputOption': 'RAW',
+                'data': [
+                    {'range': 'Sheet1!I1:J3',
+                     'values': [['Stawka', 'Czesci'], ['150.00', 'ABC'], ['', 'XYZ']]},
+                    {'range': 'Sheet2!I1:J2',
+                     'values': [['Stawka', 'Czesci'], ['200.50', '']]},
+                ]
+            }
+        )
+        spreadsheets.values.return_value.update.assert_not_called()
+    
+    def test_write_results_grouped_by_sheet_dict(self):
+        """Test that results grouped in a dict {sheet_name: results} are written in one request."""
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}},
+                       {'properties': {'sheetId': 2, 'title': 'Sheet2'}}]
+        }
+        
+        write_quadra_results_to_sheets(
+            mock_sheets, 'test_id',
+            {'Sheet1': [{'stawka': '1', 'czesci': 'A'}], 'Sheet2': [{'stawka': '2', 'czesci': 'B'}]},
+            start_row=3
+        )
+        
+        spreadsheets.get.assert_called_once()
+        batch_update = spreadsheets.values.return_value.batchUpdate
+        batch_update.assert_called_once()
+        data = batch_update.call_args.kwargs['body']['data']
+        self.assertEqual([d['range'] for d in data], ['Sheet1!I3:J4', 'Sheet2!I3:J4'])
+    
+    def test_write_results_to_several_sheets_missing_sheet(self):
+        """Test that nothing is written when one of the sheets does not exist."""
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}}]
+        }
+        
+        with self.assertRaises(ValueError) as cm:
+            write_quadra_results_to_sheets(
+                mock_sheets, 'test_id',
+                [('Sheet1', [{'stawka': '1'}]), ('Missing', [{'stawka': '2'}])]
+            )
+        
+        self.assertIn('Missing', str(cm.exception))
+        spreadsheets.values.return_value.batchUpdate.assert_not_called()
+    
+    def test_sheet_metadata_fetched_once_per_spreadsheet(self):
+        """Test that repeated writes reuse sheet metadata until a sheet is missing or cache is invalidated."""
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}}]
+        }
+        results = [{'stawka': '1', 'czesci': 'A'}]
+        
+        write_quadra_results_to_sheet(mock_sheets, 'cache_id', 'Sheet1', results)
+        write_quadra_results_to_sheet(mock_sheets, 'cache_id', 'Sheet1', results)
+        self.assertEqual(spreadsheets.get.call_count, 1)
+        
+        # A sheet added after the first fetch triggers one refresh
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}},
+                       {'properties': {'sheetId': 2, 'title': 'Sheet2'}}]
+        }
+        write_quadra_results_to_sheet(mock_sheets, 'cache_id', 'Sheet2', results)
+        self.assertEqual(spreadsheets.get.call_count, 2)
+        
+        invalidate_spreadsheet_cache('cache_id')
+        write_quadra_results_to_sheet(mock_sheets, 'cache_id', 'Sheet1', results)
+        self.assertEqual(spreadsheets.get.call_count, 3)
+    
+    def test_sheet_metadata_cache_is_bounded(self):
+        """Test that metadata of the least recently used spreadsheet is dropped when the cache is full."""
+        mock_sheets = MagicMock()
+        spreadsheets = mock_sheets.spreadsheets.return_value
+        spreadsheets.get.return_value.execute.return_value = {
+            'sheets': [{'properties': {'sheetId': 1, 'title': 'Sheet1'}}]
+        }
+        results = [{'stawka': '1', 'czesci': 'A'}]
+        
+        with patch('quadra_service._SHEET_IDS_CACHE_SIZE', 2):
+            for spreadsheet_id in ('first', 'second', 'third'):
+                write_quadra_results_to_sheet(mock_sheets, spreadsheet_id, 'Sheet1', results)
+            self.assertEqual(spreadsheets.get.call_count, 3)
+            
+            write_quadra_results_to_sheet(mock_sheets, 'third', 'Sheet1', results)
+            self.assertEqual(spreadsheets.get.call_count, 3)
+            write_quadra_results_to_sheet(mock_sheets, 'first', 'Sheet1', results)
+            self.assertEqual(spreadsheets.get.call_count, 4)
 
 
 class TestMapColumnNames(unittest.TestCase):
@@ -9,11 +9,12 @@ when rendering table headers, as described in the feature specification.
 """
 
 import unittest
-import json
-import os
-import tempfile
 from quadra_service import get_quadra_table_headers
 
+# Expected default Polish headers
+_DEFAULT_HEADERS = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci',
+                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
+
 
 class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
     """Integration tests for Quadra UI column header mapping."""
@@ -27,11 +28,7 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         # This is what happens in gui.py main() function
         headers = get_quadra_table_headers(column_names)
         
-        # Expected default Polish headers
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        
-        self.assertEqual(headers, expected)
+        self.assertListEqual(headers, _DEFAULT_HEADERS)
     
     def test_headers_with_dictionary_mapping_from_settings(self):
         """Test headers with dictionary mapping loaded from settings file."""
@@ -49,18 +46,9 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         # This is what happens in gui.py main() function
         headers = get_quadra_table_headers(column_names)
         
-        # Verify mapped columns
-        self.assertEqual(headers[0], 'Sheet')  # Arkusz -> Sheet
-        self.assertEqual(headers[2], 'Order Number')  # Numer z DBF -> Order Number
-        self.assertEqual(headers[3], 'Rate')  # Stawka -> Rate
-        self.assertEqual(headers[4], 'Parts')  # Czesci -> Parts
-        
-        # Verify unmapped columns stay as default
-        self.assertEqual(headers[1], 'Płatnik')  # Unmapped
-        self.assertEqual(headers[5], 'Status')  # Unmapped
-        self.assertEqual(headers[6], 'Kolumna')  # Unmapped
-        self.assertEqual(headers[7], 'Wiersz')  # Unmapped
-        self.assertEqual(headers[8], 'Uwagi')  # Unmapped
+        # Mapped columns replaced, unmapped columns stay as default
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Order Number', 'Rate', 'Parts',
+                                       'Status', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_headers_with_list_mapping_from_settings(self):
         """Test headers with list mapping loaded from settings file."""
@@ -122,9 +110,8 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         headers = get_quadra_table_headers(column_names)
         
         # All should match despite case differences
-        self.assertEqual(headers[0], 'Sheet')
-        self.assertEqual(headers[2], 'Order Number')
-        self.assertEqual(headers[3], 'Rate')
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Order Number', 'Rate', 'Czesci',
+                                       'Status', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_whitespace_normalization_in_mapping(self):
         """Test that mapping handles extra whitespace correctly."""
@@ -139,9 +126,8 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         headers = get_quadra_table_headers(column_names)
         
         # All should match despite whitespace differences
-        self.assertEqual(headers[0], 'Sheet')
-        self.assertEqual(headers[2], 'Order Number')
-        self.assertEqual(headers[3], 'Rate')
+        self.assertListEqual(headers, ['Sheet', 'Płatnik', 'Order Number', 'Rate', 'Czesci',
+                                       'Status', 'Kolumna', 'Wiersz', 'Uwagi'])
     
     def test_fallback_to_original_for_unmapped_columns(self):
         """Test that unmapped columns fall back to original names."""
@@ -154,18 +140,8 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         column_names = app_settings.get('quadra_column_names', None)
         headers = get_quadra_table_headers(column_names)
         
-        # Mapped column
-        self.assertEqual(headers[0], 'Sheet')
-        
-        # Unmapped columns should keep original names
-        self.assertEqual(headers[1], 'Płatnik')
-        self.assertEqual(headers[2], 'Numer z DBF')
-        self.assertEqual(headers[3], 'Stawka')
-        self.assertEqual(headers[4], 'Czesci')
-        self.assertEqual(headers[5], 'Status')
-        self.assertEqual(headers[6], 'Kolumna')
-        self.assertEqual(headers[7], 'Wiersz')
-        self.assertEqual(headers[8], 'Uwagi')
+        # Mapped column first, unmapped columns keep original names
+        self.assertListEqual(headers, ['Sheet'] + _DEFAULT_HEADERS[1:])
     
     def test_partial_list_mapping(self):
         """Test that partial list mapping works correctly."""
@@ -180,30 +156,14 @@ class TestQuadraUIHeaderMappingIntegration(unittest.TestCase):
         column_names = app_settings.get('quadra_column_names', None)
         headers = get_quadra_table_headers(column_names)
         
-        # First 3 should be mapped
-        self.assertEqual(headers[0], 'Sheet')
-        self.assertEqual(headers[1], 'Payer')
-        self.assertEqual(headers[2], 'Order Number')
-        
-        # Rest should use defaults
-        self.assertEqual(headers[3], 'Stawka')
-        self.assertEqual(headers[4], 'Czesci')
-        self.assertEqual(headers[5], 'Status')
-        self.assertEqual(headers[6], 'Kolumna')
-        self.assertEqual(headers[7], 'Wiersz')
-        self.assertEqual(headers[8], 'Uwagi')
+        # First 3 should be mapped, rest should use defaults
+        self.assertListEqual(headers, ['Sheet', 'Payer', 'Order Number'] + _DEFAULT_HEADERS[3:])
     
     def test_empty_mapping_returns_defaults(self):
         """Test that empty mapping configurations return default headers."""
-        # Empty dict
-        headers1 = get_quadra_table_headers({})
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        self.assertEqual(headers1, expected)
-        
-        # Empty list
-        headers2 = get_quadra_table_headers([])
-        self.assertEqual(headers2, expected)
+        for empty_mapping in ({}, []):
+            with self.subTest(mapping=empty_mapping):
+                self.assertListEqual(get_quadra_table_headers(empty_mapping), _DEFAULT_HEADERS)
 
 
 class TestQuadraUIEndToEndFlow(unittest.TestCase):
@@ -238,27 +198,13 @@ class TestQuadraUIEndToEndFlow(unittest.TestCase):
         # Step 3: Create Quadra tab headers (as in gui.py create_quadra_tab())
         table_headings = get_quadra_table_headers(quadra_column_names)
         
-        # Step 4: Verify all mappings applied correctly
-        expected_headers = [
-            'Sheet Name',
-            'Payer Name',
-            'DBF Order Number',
-            'Unit Rate',
-            'Parts List',
-            'Order Status',
-            'Column Location',
-            'Row Number',
-            'Additional Notes'
-        ]
-        
-        self.assertEqual(table_headings, expected_headers)
+        # Step 4: Verify all mappings applied correctly, in default column order
+        expected_headers = [quadra_column_names[name] for name in _DEFAULT_HEADERS]
+        self.assertListEqual(table_headings, expected_headers)
         
-        # Verify no original names remain
-        self.assertNotIn('Arkusz', table_headings)
-        self.assertNotIn('Płatnik', table_headings)
-        self.assertNotIn('Numer z DBF', table_headings)
-        self.assertNotIn('Stawka', table_headings)
-        self.assertNotIn('Czesci', table_headings)
+        # Every mapped name appears once and no original names remain
+        self.assertEqual(len(set(table_headings)), len(table_headings))
+        self.assertTrue(set(table_headings).isdisjoint(_DEFAULT_HEADERS))
     
     def test_backward_compatibility_without_settings(self):
         """
@@ -273,9 +219,7 @@ class TestQuadraUIEndToEndFlow(unittest.TestCase):
         table_headings = get_quadra_table_headers(quadra_column_names)
         
         # Should get default Polish headers
-        expected = ['Arkusz', 'Płatnik', 'Numer z DBF', 'Stawka', 'Czesci', 
-                    'Status', 'Kolumna', 'Wiersz', 'Uwagi']
-        self.assertEqual(table_headings, expected)
+        self.assertListEqual(table_headings, _DEFAULT_HEADERS)
 
 
 if __name__ == '__main__':
@@ -5,7 +5,6 @@ Demonstration of Quadra tab column name mapping feature.
 """
 
 import json
-import os
 from quadra_service import get_quadra_table_headers
 
 def demo_default_headers():